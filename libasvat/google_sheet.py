@@ -1,54 +1,83 @@
 import re
 import json
+import time
 import click
+import random
 import socket
+import httplib2
+import asyncio
+import functools
+import itertools
+import threading
 import traceback
 from typing import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from libasvat.data import DataCache
 from libasvat.utils import Table
 from googleapiclient import discovery
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+from google_auth_httplib2 import AuthorizedHttp
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 
 
+_PERCENT_RE = re.compile(r"^[\d.]+%$")
+"""Regex matching a percent-value (format `X%`, where X is a number)."""
+_A1_RE = re.compile(r"^([a-zA-Z]+)(\d+)$")
+"""Regex matching a cell key in A1 notation, capturing its column letters and row number."""
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+"""HTTP status codes of Sheets API responses for transient failures, which are worth retrying."""
+_NON_IDEMPOTENT_RETRY_STATUSES = (429, 503)
+"""HTTP status codes of transient failures returned before the request did any work, so even non-idempotent
+requests can be retried on them."""
+
+
 class Cell:
-    """Represents a editable cell from a Row in a Google Sheet."""
+    """Represents a editable cell from a Row in a Google Sheet.
+
+    Cells don't store their values: they are lightweight views of a single value from their parent Row, which stores
+    the values of all of its cells. Cell objects are created on demand when accessing the row's cells.
+    """
+
+    __slots__ = ("parent", "index")
 
-    def __init__(self, parent: 'Row', index: int, value: str):
+    def __init__(self, parent: 'Row', index: int):
         self.parent = parent
         self.index = index
-        self._value = value
-        self.original_value = self.value
 
     @property
-    def value(self):
-        return self._value
+    def value(self) -> str:
+        return self.parent.values[self.index]
 
     @value.setter
     def value(self, v):
         if v is None:
-            self._value = ""
+            v = ""
         elif isinstance(v, bool):
-            self._value = "TRUE" if v else "FALSE"
+            v = "TRUE" if v else "FALSE"
         else:
             # TODO: como determinar que recebeu um float que deve ser formatado com `N%` na cell? Tratamos isso no as_float()
-            self._value = str(v)
+            v = str(v)
+        row = self.parent
+        if v != row.values[self.index]:
+            row.values[self.index] = v
+            if not row._dirty:
+                row.parent._dirty_rows[row.index] = row
+            row._dirty |= 1 << self.index
 
     def get_letter_index(self):
         """Gets the A1 notation key of this cell, uniquely identifying it in our sheet."""
-        # using index+1 here since in Python indexes start from 0, but in sheets (for this letter notation), they start from 1.
-        letter = columnToLetter(self.index + 1)
-        return f"{letter}{self.parent.index + 1}"
+        return _get_a1_key(self.index, self.parent.index)
 
     def was_changed(self):
         """Checks if this cell was changed"""
-        return self._value != self.original_value
+        return bool(self.parent._dirty & (1 << self.index))
 
     def save_changes(self):
         """Saves changes made in this cell"""
-        self.original_value = self._value
+        self.parent._dirty &= ~(1 << self.index)
 
     def as_str(self):
         """Gets this cell's value as a string. Returns None if value is invalid (like an empty string)."""
@@ -69,12 +98,7 @@ class Cell:
         If the cell's value is a percent-value (format `X%`, where X is a number), then this
         will return `X / 100` to convert the percent to a proper numeric value.
         """
-        try:
-            if re.match(r"^[\d.]+[%]$", self.value):
-                return float(self.value.replace("%", "")) / 100.0
-            return float(self.value)
-        except Exception:
-            return None
+        return _value_as_float(self.value)
 
     def as_bool(self):
         """Gets this cell's value as a boolean."""
@@ -106,16 +130,36 @@ class Cell:
         return f"{self.parent}.Cell#{self.index} ({self.get_letter_index()})"
 
     def __hash__(self):
-        return hash(self.value)
+        # Hashing only by column index keeps the hash stable when the value changes and doesn't need to hash the
+        # (possibly long) value string, while still being consistent with `__eq__` between cells.
+        return hash(self.index)
 
 
 class Row:
-    """Represents a editable row in a Google Sheet."""
+    """Represents a editable row in a Google Sheet.
+
+    The row stores the values of all of its cells, while the Cell objects returned when accessing the row are
+    views of these values.
+    """
+
+    __slots__ = ("parent", "index", "values", "_dirty")
 
-    def __init__(self, parent: 'Sheet', index: int, cells):
+    def __init__(self, parent: 'Sheet', index: int, values: list[str]):
         self.parent = parent
         self.index = index
-        self.cells: list[Cell] = [Cell(self, i, value) for i, value in enumerate(cells)]
+        values = list(values)
+        # Trailing empty cells are trimmed. They are added back on demand when accessed (see `_extend_cells_to_index`).
+        while values and (values[-1] is None or values[-1] == ""):
+            values.pop()
+        self.values: list[str] = values
+        """The values of this row's cells, ordered from first column to last."""
+        self._dirty: int = 0
+        """Bitmask of the cells of this row which had their values changed: bit N is set if cell N was changed."""
+
+    @property
+    def cells(self) -> tuple[Cell, ...]:
+        """The cells of this row, ordered from first column to last."""
+        return tuple(self)
 
     def is_header(self):
         """Checks if this row is a header row"""
@@ -126,11 +170,9 @@ class Row:
 
         Each key:value pair matches a cell. The key is the cell's value in the header row (same column), and the value is the actual cell's value.
         """
-        key_indexes = self.parent.get_header_indexes()
-        data: dict[str, str] = {}
-        for key, i in key_indexes.items():
-            data[key] = self[i].value
-        return data
+        values = self.values
+        num_values = len(values)
+        return {key: (values[i] if i < num_values else None) for i, key in enumerate(self.parent.get_header_keys())}
 
     def erase(self):
         """Erases this row, setting the value of all our cells to `None`.
@@ -140,23 +182,38 @@ class Row:
         Note that this does NOT save the changes to the row/sheet! Do that yourself by calling
         the parent's Sheet `save()` method.
         """
-        for cell in self.cells:
+        for cell in self:
             cell.value = None
         # TODO: actual deletion of the row?
 
+    def get_changed_indexes(self):
+        """Gets the (sorted) indexes of the cells of this row which had their values changed."""
+        indexes: list[int] = []
+        dirty = self._dirty
+        while dirty:
+            lowest_bit = dirty & -dirty
+            indexes.append(lowest_bit.bit_length() - 1)
+            dirty ^= lowest_bit
+        return indexes
+
+    def save_changes(self):
+        """Saves changes made in all cells of this row."""
+        self._dirty = 0
+
     def __getitem__(self, key) -> Cell:
         if isinstance(key, int):
             # return cell by index
+            if key < 0:
+                key += len(self.values)
             self._extend_cells_to_index(key)
-            return self.cells[key]
+            return Cell(self, key)
         elif isinstance(key, str):
             # return cell by key
-            key_indexes = self.parent.get_header_indexes()
-            if key not in key_indexes:
+            index = self.parent.get_header_indexes().get(key)
+            if index is None:
                 raise KeyError(f"invalid cell key '{key}'")
-            index = key_indexes[key]
             self._extend_cells_to_index(index)
-            return self[index]
+            return Cell(self, index)
         # TODO: implement slice support and failsafes
         raise KeyError(f"invalid cell index/key '{key}' (a {type(key)} value)")
 
@@ -167,25 +224,25 @@ class Row:
         if isinstance(key, int):
             return True
         elif isinstance(key, str):
-            key_indexes = self.parent.get_header_indexes()
-            return key in key_indexes
+            return key in self.parent.get_header_indexes()
         return False
 
     def _extend_cells_to_index(self, index):
         """Extends this row's cells up to the given index (inclusive)"""
-        if index >= len(self.cells):
-            for i in range(len(self.cells), index + 1):
-                self.cells.append(Cell(self, i, None))
+        if index >= len(self.values):
+            self.values.extend([None] * (index + 1 - len(self.values)))
 
     def __iter__(self) -> Iterator[Cell]:
-        return iter(self.cells)
+        # map() creates the cell views in C, without a python generator frame per cell.
+        num_cells = len(self.values)
+        return map(Cell, itertools.repeat(self, num_cells), range(num_cells))
 
     def __len__(self):
-        return len(self.cells)
+        return len(self.values)
 
     def __eq__(self, other):
         if isinstance(other, Row):
-            return self.parent == other.parent and self.index == other.index and self.cells == other.cells
+            return self.parent == other.parent and self.index == other.index and self.values == other.values
         return False
 
     def __str__(self):
@@ -214,6 +271,9 @@ class Sheet:
     _default_creds: 'SheetCredentials' = None
     """Default SheetCredentials object to use for authenticating Sheet API requests."""
 
+    max_retries: int = 3
+    """Maximum number of times a Sheets API request is retried after a transient failure (see ``self._execute()``)."""
+
     def __init__(self, sheet_id: str, sheet_name: str, creds: 'SheetCredentials' = None, verbose=False):
         """
         Args:
@@ -229,10 +289,16 @@ class Sheet:
         identified by their name (see ``sheet_name``) or more rarely, their ID."""
         self.sheet_name = sheet_name
         self._table_id: int = None
-        self.rows: list[Row] = []
-        """The list of rows of this sheet. Each row itself is a list of Cells, ordered from first column to last."""
+        self._rows: list[Row | None] = []
+        """The rows of this sheet. Rows are created lazily from ``self._raw_rows`` when first accessed, so this
+        is None for rows that weren't accessed yet."""
+        self._raw_rows: list[list[str] | None] = []
+        """The raw values of each row of this sheet, as loaded from the API. Cleared once the row is created."""
+        self._dirty_rows: dict[int, Row] = {}
+        """Rows which (may) have changed cells, by their index. Used to only check these rows when saving."""
         self.header: Row = Row(self, -1, [])
         self._header_indexes: dict[str, int] = None
+        self._header_keys: tuple[str, ...] = None
         """This is the header row."""
         self.verbose = verbose
         self._is_loaded = False
@@ -240,8 +306,9 @@ class Sheet:
 
     def set_header_row(self, header_index):
         """Define a row to be used for keying other rows"""
-        self.header = self.rows[header_index]
+        self.header = self._get_row(header_index)
         self._header_indexes = None
+        self._header_keys = None
 
     def get_header_indexes(self):
         """Gets a table of {column key -> column index}, based on the cells of the header row.
@@ -250,39 +317,91 @@ class Sheet:
             self._header_indexes = {cell.value: index for index, cell in enumerate(self.header)}
         return self._header_indexes
 
+    def get_header_keys(self):
+        """Gets a tuple of the column keys, based on the cells of the header row.
+        The key for a column is the item in this tuple with the same index as the column."""
+        if self._header_keys is None:
+            self._header_keys = tuple(cell.value for cell in self.header)
+        return self._header_keys
+
+    @property
+    def rows(self):
+        """The list of rows of this sheet. Each row itself is a list of Cells, ordered from first column to last.
+
+        Accessing this will create all rows that weren't created yet. Prefer the other row-accessing methods of
+        the Sheet, which only create the rows that are used."""
+        return [self._get_row(i) for i in range(len(self._rows))]
+
+    def _get_row(self, index: int):
+        """Gets the row with the given (absolute) index, creating it from its raw values if needed."""
+        row = self._rows[index]
+        if row is None:
+            row = Row(self, index, self._raw_rows[index])
+            self._rows[index] = row
+            self._raw_rows[index] = None
+        return row
+
+    def _get_row_values(self, index: int) -> list[str]:
+        """Gets the cell values of the row with the given (absolute) index, without creating the row."""
+        row = self._rows[index]
+        if row is None:
+            return self._raw_rows[index]
+        return row.values
+
     def get_rows(self):
         """Return all rows that exist after the header index."""
-        return self.rows[self.header.index + 1:]
+        return [self._get_row(i) for i in range(self.header.index + 1, len(self._rows))]
 
     def get_row(self, index) -> Row | None:
         """Gets the Row with the given relative INDEX to the header-row.
         Returns None if the index is out-of-bounds.
         """
         actual_index = self.header.index + index + 1
-        if 0 <= actual_index < len(self.rows):
-            return self.rows[actual_index]
+        if 0 <= actual_index < len(self._rows):
+            return self._get_row(actual_index)
 
     def add_new_row(self):
         """Adds a new empty row to the end of the sheet."""
-        row = Row(self, len(self.rows), [])
-        self.rows.append(row)
+        row = Row(self, len(self._rows), [])
+        self._rows.append(row)
+        self._raw_rows.append(None)
         return row
 
     def get_cell(self, key: str):
         """Gets the cell by its KEY - its A1 notation index."""
         # TODO: allow key ranges as in sheets to return a list of cells?
-        values = re.match(r"^([a-zA-Z]+)(\d+)$", key)
+        values = _A1_RE.match(key)
         if not values:
             raise KeyError(f"Given key '{key}' is not in A1 notation")
         column_letter = values.group(1)
         # remember A1 key indexes start from 1, and we use from 0 here.
         row_index = int(values.group(2)) - 1
-        if row_index >= len(self.rows):
+        if row_index >= len(self._rows):
             raise IndexError(f"Row index from A1 key '{key}' is invalid")
-        row = self.rows[row_index]
+        row = self._get_row(row_index)
         cell_index = letterToColumn(column_letter) - 1
         return row[cell_index]
 
+    def as_float_column(self, key: str | int):
+        """Gets the values of a column as floats, for all rows after the header row.
+
+        This converts the values the same way as ``Cell.as_float()``, but directly from the rows' values,
+        without creating the Cell objects.
+
+        Args:
+            key (str | int): the column key (the value of the column's cell in the header row) or the column index.
+
+        Returns:
+            list[float]: list of values of the column, in the order of the rows. Values are None for invalid numbers.
+        """
+        if isinstance(key, str):
+            column_key = key
+            key = self.get_header_indexes().get(column_key)
+            if key is None:
+                raise KeyError(f"invalid cell key '{column_key}'")
+        values = [self._get_row_values(i) for i in range(self.header.index + 1, len(self._rows))]
+        return [_value_as_float(row_values[key]) if key < len(row_values) else None for row_values in values]
+
     def __getitem__(self, key: str):
         return self.get_cell(key)
 
@@ -291,11 +410,11 @@ class Sheet:
         cell.value = value
 
     def __iter__(self) -> Iterator[Row]:
-        return iter(self.get_rows())
+        return (self._get_row(i) for i in range(self.header.index + 1, len(self._rows)))
 
     def get_size(self):
         """Gets the number of rows that exist after the header row."""
-        return len(self.get_rows())
+        return max(0, len(self._rows) - (self.header.index + 1))
 
     @property
     def _service(self):
@@ -312,56 +431,107 @@ class Sheet:
     def load(self):
         """Loads the sheet data from this object, using our credentials for authentication.
         Returns a boolean indicating if loading was successfull or not."""
-        retry = 0
-        max_retries = 3
-
         self._log(f"Downloading sheet '{self.sheet_name}'")
 
-        while retry <= max_retries:
-            try:
-                ranges = [f"'{self.sheet_name}'!A1:ZZ"]
-
-                result = self._service.spreadsheets().values().batchGet(spreadsheetId=self.sheet_id, ranges=ranges).execute()
-                for index, row_data in enumerate(result["valueRanges"][0].get('values', [])):
-                    self.rows.append(Row(self, index, row_data))
-                self.set_header_row(0)
-                self._is_loaded = True
-                return True
-            except socket.timeout:
-                if retry <= max_retries:
-                    retry += 1
-                    self._log(f"Retry {retry} of {max_retries}.", fg="yellow")
-
-            except HttpError:
-                self._log(f"No sheet found for '{self.sheet_name}': {traceback.format_exc()}", fg="red", ignore_verbose=True)
-                return False
-        self._log("Requests timed out, couldn't fetch spreadsheet.", fg="red", ignore_verbose=True)
-        return False
+        # A range with just the sheet name selects the whole sheet, and the API only returns its used cells.
+        ranges = [f"'{self.sheet_name}'"]
+        # A single spreadsheets.get() request returns both our sheet's properties (giving our table-id) and its
+        # cell values. Only the fields we need are requested, so the response is as small as possible.
+        fields = "sheets(properties(sheetId,title),data(rowData(values(formattedValue))))"
+        try:
+            request = self._service.spreadsheets().get(spreadsheetId=self.sheet_id, ranges=ranges, includeGridData=True, fields=fields)
+            result = self._execute(request)
+        except socket.timeout:
+            self._log("Requests timed out, couldn't fetch spreadsheet.", fg="red", ignore_verbose=True)
+            return False
+        except HttpError:
+            self._log(f"No sheet found for '{self.sheet_name}': {traceback.format_exc()}", fg="red", ignore_verbose=True)
+            return False
+
+        sheet_data = result["sheets"][0]
+        self._table_id = int(sheet_data["properties"]["sheetId"])
+        grid_data = sheet_data.get("data", [{}])[0]
+        # Row objects are only created when each row is first accessed.
+        self._raw_rows = [[value.get("formattedValue", "") for value in row_data.get("values", [])]
+                          for row_data in grid_data.get("rowData", [])]
+        self._rows = [None] * len(self._raw_rows)
+        self._dirty_rows.clear()
+        self.set_header_row(0)
+        self._is_loaded = True
+        return True
+
+    async def load_async(self):
+        """Async version of ``self.load()``.
+
+        The blocking load request is executed in a worker thread, so multiple sheets can be loaded concurrently
+        (see ``Sheet.gather_load()``) without blocking the event loop.
+        Returns a boolean indicating if loading was successfull or not."""
+        return await asyncio.to_thread(self.load)
+
+    @classmethod
+    async def gather_load(cls, sheets: list['Sheet']):
+        """Loads all given sheets concurrently, overlapping the network round-trips of their requests.
+
+        Args:
+            sheets (list[Sheet]): the sheets to load.
+
+        Returns:
+            list[bool]: the result of ``load()`` for each sheet, in the same order as given.
+        """
+        return await asyncio.gather(*(sheet.load_async() for sheet in sheets))
 
     def save(self):
-        """Checks all of our cells which had their values changed and saves these changes into the remote sheet."""
+        """Checks all of our cells which had their values changed and saves these changes into the remote sheet.
+
+        Changed cells are coalesced into as few ranges as possible: consecutive changed cells in a row are sent as
+        a single range, and equal column-runs in consecutive rows are merged into a single rectangular range."""
         try:
+            changed_rows: list[Row] = []
+            num_changes = 0
+            ranges: list[dict] = []
+            # Ranges from the previous row, keyed by their (start, end) column indexes, which may be extended by the next row.
+            previous_runs: dict[tuple[int, int], dict] = {}
+            previous_row_index = None
+            for index in sorted(self._dirty_rows):
+                row = self._dirty_rows[index]
+                if index < 0 or index >= len(self._rows) or self._rows[index] is not row:
+                    # Not one of our rows (such as the placeholder header of a sheet that isn't loaded).
+                    continue
+                changed_indexes = row.get_changed_indexes()
+                if changed_indexes:
+                    changed_rows.append(row)
+                    num_changes += len(changed_indexes)
+                current_runs: dict[tuple[int, int], dict] = {}
+                for run in _get_index_runs(changed_indexes):
+                    start, end = run
+                    values = row.values[start:end + 1]
+                    entry = previous_runs.get(run) if previous_row_index == row.index - 1 else None
+                    if entry is not None:
+                        entry["last_row"] = row.index
+                        entry["values"].append(values)
+                    else:
+                        entry = {"first_row": row.index, "last_row": row.index, "start": start, "end": end, "values": [values]}
+                        ranges.append(entry)
+                    current_runs[run] = entry
+                previous_runs = current_runs
+                previous_row_index = row.index
+
             body = {
                 "valueInputOption": "RAW",
-                "data": []
+                "data": [{
+                    "range": f"'{self.sheet_name}'!{_get_a1_key(entry['start'], entry['first_row'])}"
+                             f":{_get_a1_key(entry['end'], entry['last_row'])}",
+                    "values": entry["values"]
+                    # values is a list of list of values (so rows of cells) of the values changed in this range.
+                } for entry in ranges]
             }
-            for row in self.rows:
-                for cell in row:
-                    if cell.was_changed():
-                        # NOTE: we're saving by specifying each modified cell as its own range to save in the command.
-                        # Since the API allows to save ranges of cells in a single go, this might not be the most efficient method...
-                        body["data"].append({
-                            "range": f"'{self.sheet_name}'!{cell.get_letter_index()}",
-                            "values": [[cell.value]]  # yes, double-list here
-                            # values is a list of list of values (so rows of cells) of the values changed in this range.
-                            # since we are altering cell-by-cell, its a simple double list with the value.
-                        })
-                        cell.save_changes()
-
-            num_changes = len(body["data"])
+
             if num_changes > 0:
-                self._service.spreadsheets().values().batchUpdate(spreadsheetId=self.sheet_id, body=body).execute()
-                self._log(f"Sheet '{self.sheet_name}': saved changes in {num_changes} cells", fg="green")
+                self._execute(self._service.spreadsheets().values().batchUpdate(spreadsheetId=self.sheet_id, body=body))
+                for row in changed_rows:
+                    row.save_changes()
+                self._dirty_rows.clear()
+                self._log(f"Sheet '{self.sheet_name}': saved changes in {num_changes} cells ({len(ranges)} ranges)", fg="green")
             else:
                 self._log(f"Sheet '{self.sheet_name}': no changes to save", fg="green")
             return True
@@ -369,6 +539,14 @@ class Sheet:
             self._log(f"Couldn't write to sheet '{self.sheet_name}': {traceback.format_exc()}", fg="red", ignore_verbose=True)
             return False
 
+    async def save_async(self):
+        """Async version of ``self.save()``.
+
+        The blocking save request is executed in a worker thread, so multiple sheets can be saved concurrently
+        without blocking the event loop.
+        Returns a boolean indicating if saving was successfull or not."""
+        return await asyncio.to_thread(self.save)
+
     def duplicate(self, target_sheet_id: str):
         """Duplicates this sheet to the target spreadsheet.
 
@@ -398,7 +576,8 @@ class Sheet:
             "destinationSpreadsheetId": target_sheet_id
         }
         try:
-            response = spreadsheets.sheets().copyTo(spreadsheetId=self.sheet_id, sheetId=self.get_table_id(), body=body).execute()
+            response = self._execute(spreadsheets.sheets().copyTo(spreadsheetId=self.sheet_id, sheetId=self.get_table_id(), body=body),
+                                     idempotent=False)
             # copyTo() response is essentially the "sheet properties" dict that is also used in few other requests.
         except:
             self._log(f"{self}: failed to duplicate sheet to '{target_sheet_id}': {traceback.format_exc()}", fg="red", ignore_verbose=True)
@@ -422,8 +601,8 @@ class Sheet:
 
         The first time this used, a request will be made to the Sheets API in order to query our sheet-ID based on
         our sheet name. Afterwards, the ID is cached in this instance and will be reused by this method instead of
-        re-doing the request. However, some methods of creating a sheet (such as duplicating it) will also set the
-        sheet's ID, so the request is never needed.
+        re-doing the request. However, loading the sheet and some methods of creating a sheet (such as duplicating it)
+        will also set the sheet's ID, so the request is never needed.
 
         Returns:
             int: sheet ID that uniquely identifies this sheet within its spreadsheet. Returns None if we failed to
@@ -432,7 +611,7 @@ class Sheet:
         if self._table_id is None:
             spreadsheets = self._service.spreadsheets()
             try:
-                response = spreadsheets.get(spreadsheetId=self.sheet_id).execute()
+                response = self._execute(spreadsheets.get(spreadsheetId=self.sheet_id))
             except:
                 self._log(f"{self}: failed to get table-id: {traceback.format_exc()}", fg="red", ignore_verbose=True)
                 return
@@ -478,7 +657,7 @@ class Sheet:
         # including: adding/deleting/duplicate sheets, setting formatting (colors, borders, etc), cell validation
         # rules, and more.
         try:
-            response = spreadsheets.batchUpdate(spreadsheetId=self.sheet_id, body=body).execute()
+            response = self._execute(spreadsheets.batchUpdate(spreadsheetId=self.sheet_id, body=body))
             response = Table(**response)
         except Exception:
             self._log(f"{self}: failed to rename sheet to '{new_sheet_name}': {traceback.format_exc()}", fg="red", ignore_verbose=True)
@@ -493,6 +672,41 @@ class Sheet:
         """
         cls._default_creds = creds
 
+    def _execute(self, request: HttpRequest, idempotent=True):
+        """Executes the given Sheets API request, returning its response.
+
+        Transient failures (timeouts, rate-limit `429` and server `5xx` errors) are retried up to ``self.max_retries``
+        times, with exponential backoff and jitter between attempts. If a failed response has a `Retry-After` header,
+        its delay is used instead. If all retries fail (or on other errors), the last error is raised.
+
+        Args:
+            request (HttpRequest): the API request to execute.
+            idempotent (bool, optional): if the request can be safely repeated. Non-idempotent requests (such as
+                ``copyTo``) may have been done by the server even if we got a timeout or `5xx` error, so they're only
+                retried on `429` and `503` errors, which are returned before doing any work. Defaults to True.
+        """
+        retry_statuses = _RETRY_STATUSES if idempotent else _NON_IDEMPOTENT_RETRY_STATUSES
+        attempt = 0
+        while True:
+            try:
+                return request.execute()
+            except (socket.timeout, HttpError) as e:
+                is_http_error = isinstance(e, HttpError)
+                if is_http_error:
+                    is_retryable = e.resp.status in retry_statuses
+                else:
+                    is_retryable = idempotent
+                if not is_retryable or attempt >= self.max_retries:
+                    raise
+                attempt += 1
+                delay = random.uniform(0, 2 ** attempt)
+                retry_after = e.resp.get("retry-after") if is_http_error else None
+                if retry_after is not None and retry_after.isdigit():
+                    delay = float(retry_after)
+                reason = f"status {e.resp.status}" if is_http_error else "timed out"
+                self._log(f"{self}: request failed ({reason}). Retry {attempt} of {self.max_retries} in {delay:.1f}s.", fg="yellow")
+                time.sleep(delay)
+
     def _log(self, msg, fg="white", ignore_verbose=False):
         """Logs a message to the console if verbose output is enabled."""
         if self.verbose or ignore_verbose:
@@ -502,6 +716,42 @@ class Sheet:
         return f"Sheet[{self.sheet_name}]"
 
 
+def load_sheets(sheets: list[Sheet], max_workers=20):
+    """Loads all given sheets concurrently, using a pool of worker threads.
+
+    Each sheet's ``load()`` request is blocked by Google's network round-trip, so loading them in parallel
+    takes about the same time as loading a single sheet.
+
+    Args:
+        sheets (list[Sheet]): the sheets to load.
+        max_workers (int, optional): maximum number of concurrent requests. Defaults to 20.
+
+    Returns:
+        list[bool]: the result of ``load()`` for each sheet, in the same order as given.
+    """
+    if len(sheets) <= 0:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(sheets))) as executor:
+        return list(executor.map(Sheet.load, sheets))
+
+
+def save_sheets(sheets: list[Sheet], max_workers=20):
+    """Saves all given sheets concurrently, using a pool of worker threads.
+
+    Args:
+        sheets (list[Sheet]): the sheets to save.
+        max_workers (int, optional): maximum number of concurrent requests. Defaults to 20.
+
+    Returns:
+        list[bool]: the result of ``save()`` for each sheet, in the same order as given.
+    """
+    if len(sheets) <= 0:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(sheets))) as executor:
+        return list(executor.map(Sheet.save, sheets))
+
+
+@functools.lru_cache(maxsize=4096)
 def columnToLetter(column):
     """Converts a numerical column index to its equivalent sheets column letter. So:
     * 1 => A
@@ -520,6 +770,7 @@ def columnToLetter(column):
     return letter
 
 
+@functools.lru_cache(maxsize=4096)
 def letterToColumn(letter):
     """Converts a sheets column letter to its equivalent numerical index. So:
     * A => 1
@@ -536,6 +787,48 @@ def letterToColumn(letter):
     return column
 
 
+_COL_LETTERS = tuple(columnToLetter(i) for i in range(1, 1001))
+"""Precomputed column letters for the first 1000 columns, indexed by (0-based) column index."""
+
+
+@functools.lru_cache(maxsize=65536)
+def _get_a1_key(column_index: int, row_index: int):
+    """Gets the A1 notation key of a cell from its (0-based) column and row indexes.
+    Keys are cached, since a cell's key never changes."""
+    # using index+1 here since in Python indexes start from 0, but in sheets (for this letter notation), they start from 1.
+    letter = _COL_LETTERS[column_index] if column_index < len(_COL_LETTERS) else columnToLetter(column_index + 1)
+    return f"{letter}{row_index + 1}"
+
+
+def _value_as_float(value: str):
+    """Converts the given cell value to a float. Returns None if value is not a valid number.
+
+    If value is a percent-value (format `X%`, where X is a number), then this will return `X / 100`.
+    """
+    try:
+        if _PERCENT_RE.match(value):
+            return float(value[:-1]) / 100.0
+        return float(value)
+    except Exception:
+        return None
+
+
+def _get_index_runs(indexes: list[int]):
+    """Groups the given sorted list of indexes into runs of consecutive indexes. So:
+    * [1, 2, 3, 5, 7, 8] => [(1, 3), (5, 5), (7, 8)]
+
+    Returns:
+        list[tuple[int, int]]: list of (start, end) inclusive index runs.
+    """
+    runs: list[tuple[int, int]] = []
+    for index in indexes:
+        if runs and runs[-1][1] == index - 1:
+            runs[-1] = (runs[-1][0], index)
+        else:
+            runs.append((index, index))
+    return runs
+
+
 class SheetCredentials:
     """Abstract base class that represents the Credentials required to authenticate
     requests to the Google API.
@@ -545,8 +838,19 @@ class SheetCredentials:
     Subclasses of this should implement their actual logic for getting the credentials.
     """
 
+    http_timeout: float = 30
+    """Timeout (in seconds) of the HTTP connections used by the Sheets API service."""
+    discovery_cache_ttl: float = 7 * 24 * 60 * 60
+    """Time (in seconds) for which the Sheets API discovery document cached in the DataCache is considered valid.
+    After this, the document is downloaded again."""
+
     def __init__(self):
-        self._service: discovery.Resource = None
+        self._google_creds: Credentials = None
+        self._discovery_doc: dict = None
+        """The parsed Sheets API discovery document. Parsed only once, and shared by the services of all threads."""
+        self._lock = threading.Lock()
+        self._thread_data = threading.local()
+        """Per-thread data. Each thread has its own service object, since the underlying HTTP client isn't thread-safe."""
 
     def get_credentials(self, scopes: list[str]) -> Credentials:
         """Gets the auth credentials for Google API using the given scopes."""
@@ -559,24 +863,68 @@ class SheetCredentials:
     def cleanup(self):
         """Cleans up this Credentials object, doing any operation it needs to clean up whatever resources it
         used, such as removing locally stored data."""
-        self._service = None
+        self._google_creds = None
+        self._discovery_doc = None
+        self._thread_data = threading.local()
 
     def get_service(self) -> discovery.Resource:
         """Gets the Google's Resource service, used to call Sheets API commands, using these credentials.
 
-        The authenticated service object is cached in this SheetCredentials object, so further calls to this method
-        will return the cached object.
+        The authenticated service object is cached in this SheetCredentials object (one per thread, since the service
+        isn't thread-safe), so further calls to this method will return the cached object.
+        """
+        service: discovery.Resource = getattr(self._thread_data, "service", None)
+        if service is None:
+            discovery_doc = self._get_discovery_document()
+            google_creds = self._get_google_credentials()
+            # The authorized HTTP client keeps its connections alive, so consecutive requests from this thread reuse
+            # the same TCP+TLS connection instead of re-doing the handshake on every request.
+            authed_http = AuthorizedHttp(google_creds, http=httplib2.Http(timeout=self.http_timeout))
+            service = discovery.build_from_document(discovery_doc, http=authed_http)
+            self._thread_data.service = service
+        return service
+
+    def _get_discovery_document(self):
+        """Gets the Sheets API discovery document, used to build the service object.
+
+        The document is cached in this object and in the DataCache (if its app-name is set), so it's only
+        downloaded again once the cached document is older than ``self.discovery_cache_ttl``.
         """
-        if self._service is None:
-            discovery_url = "https://sheets.googleapis.com/$discovery/rest?version=v4"
-            # For now use the same scopes for all sheets since its easier and there's been no need for custom scopes per-sheet.
-            scopes = [
-                'https://www.googleapis.com/auth/spreadsheets.readonly',
-                'https://www.googleapis.com/auth/spreadsheets'
-            ]
-            google_creds = self.get_credentials(scopes)
-            self._service = discovery.build('sheets', 'v4', credentials=google_creds, discoveryServiceUrl=discovery_url, cache_discovery=False)
-        return self._service
+        with self._lock:
+            if self._discovery_doc is None:
+                cache_key = "sheets_discovery_v4"
+                cache = DataCache()
+                try:
+                    cached = cache.get_custom_cache(cache_key)
+                except RuntimeError:
+                    # DataCache's app-name isn't set, so we can't persist the document.
+                    cache = cached = None
+                if cached is not None and time.time() - cached["time"] < self.discovery_cache_ttl:
+                    document = cached["document"]
+                else:
+                    discovery_url = "https://sheets.googleapis.com/$discovery/rest?version=v4"
+                    response, content = httplib2.Http(timeout=self.http_timeout).request(discovery_url)
+                    if response.status != 200:
+                        raise HttpError(response, content, uri=discovery_url)
+                    document = content.decode("utf-8")
+                    if cache is not None:
+                        cache.save_custom_cache(cache_key, {"time": time.time(), "document": document})
+                # Building the service from a parsed document skips re-parsing its JSON for each service we build.
+                self._discovery_doc = json.loads(document)
+            return self._discovery_doc
+
+    def _get_google_credentials(self):
+        """Gets the cached google auth credentials, shared between all threads.
+        The first time this is called, the credentials will be acquired with ``self.get_credentials()``."""
+        with self._lock:
+            if self._google_creds is None:
+                # For now use the same scopes for all sheets since its easier and there's been no need for custom scopes per-sheet.
+                scopes = [
+                    'https://www.googleapis.com/auth/spreadsheets.readonly',
+                    'https://www.googleapis.com/auth/spreadsheets'
+                ]
+                self._google_creds = self.get_credentials(scopes)
+            return self._google_creds
 
 
 class UserLoginCredentials(SheetCredentials):
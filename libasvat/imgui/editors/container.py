@@ -1,11 +1,19 @@
+from typing import Callable
 from libasvat.imgui.colors import Colors
 from libasvat.imgui.general import adv_button
-from libasvat.imgui.editors.database import TypeDatabase
+from libasvat.imgui.editors.database import TypeDatabase, _TYPE_DB
 from libasvat.imgui.editors.editor import TypeEditor, imgui_property
 from libasvat.imgui.editors.controller import get_all_renderable_properties
 from imgui_bundle import imgui, imgui_ctx
 
 
+# Tooltips of the ListEditor buttons.
+_REMOVE_ITEM_HELP = "Removes this item from the list."
+_MOVE_ITEM_UP_HELP = "Moves this item up in the list: changes position of this item with the previous item."
+_MOVE_ITEM_DOWN_HELP = "Moves this item down in the list: changes position of this item with the next item."
+_ADD_ITEM_HELP = "Adds a new default item to the list. The item can then be edited."
+
+
 class ContainerTypeEditor(TypeEditor):
     """TypeEditor subclass for "container" types.
 
@@ -16,16 +24,20 @@ class ContainerTypeEditor(TypeEditor):
     can have multiple controls to edit its different values, often employing sub-TypeEditors for each of the values.
 
     As such, this simple class overrides TypeEditor's ``draw_header/footer()`` methods to draw the value-editor inside
-    a imgui tree-node, if its opened by the user.
+    a imgui tree-node, if its opened by the user. When the node is collapsed, ``render_property()`` skips the
+    value-editor entirely, so subclasses don't need to check for that in their ``draw_value_editor()``.
     """
 
+    __slots__ = ()
+
     def __init__(self, config: dict):
         super().__init__(config)
         self.add_tooltip_after_value = False
 
     def draw_header(self, obj, name):
         opened = imgui.tree_node(self.get_name_to_show(name))
-        imgui.set_item_tooltip(self.attr_doc)
+        if self.attr_doc:
+            imgui.set_item_tooltip(self.attr_doc)
         return opened
 
     def draw_footer(self, obj, name, header_ok):
@@ -37,10 +49,13 @@ class ContainerTypeEditor(TypeEditor):
 class ListEditor(ContainerTypeEditor):
     """Imgui TypeEditor for editing a LIST value."""
 
+    __slots__ = ("min_items", "max_items", "item_config", "item_factory", "item_editors", "has_container_items")
+
+    convert_value_to_type = True
+    extra_accepted_input_types = tuple | set
+
     def __init__(self, config: dict):
         super().__init__(config)
-        self.convert_value_to_type = True
-        self.extra_accepted_input_types = tuple | set
         self.color = Colors.yellow
         # List editor attributes
         self.min_items: int = config.get("min_items", 0)
@@ -51,7 +66,10 @@ class ListEditor(ContainerTypeEditor):
         self.item_config: dict = config.get("item_config", {})
         """Base configuration for each item TypeEditor."""
         item_type = self.value_subtypes[0]
-        self.item_editors: list[TypeEditor] = [TypeDatabase().get_editor(item_type, self.item_config)]
+        self.item_factory: Callable[[], any] = config.get("item_factory") or item_type
+        """Callable (without arguments) used to create new items for the list (see ``self.create_new_item()``).
+        Defaults to the item-type itself. Can be used to create items more cheaply, such as copying a prototype item."""
+        self.item_editors: list[TypeEditor] = [_TYPE_DB.get_editor(item_type, self.item_config)]
         """TypeEditor for the items in the list. This is used to edit each item in the list."""
         self.has_container_items: bool = issubclass(type(self.item_editors[0]), ContainerTypeEditor)
         """Indicates if our Item Type is a container type (a type that has multiple values). This affects how we draw each item in the editor."""
@@ -69,38 +87,41 @@ class ListEditor(ContainerTypeEditor):
             num_items = self.min_items
             changed = True
         # Update list if has more than maximum itens.
-        if num_items > self.max_items:
+        if self.max_items is not None and num_items > self.max_items:
             value = value[:self.max_items]
             num_items = self.max_items
             changed = True
         # Render editor for each item
         can_remove = num_items > self.min_items
-        remove_help = "Removes this item from the list."
-        up_help = "Moves this item up in the list: changes position of this item with the previous item."
-        down_help = "Moves this item down in the list: changes position of this item with the next item."
-        for i in range(num_items):
+        # Local aliases for the functions called for every item below.
+        push_id = imgui_ctx.push_id
+        same_line = imgui.same_line
+        button = adv_button
+        # Scope item IDs by the list object (as a string: 64-bit ids don't fit imgui's int IDs), then by index.
+        imgui.push_id(str(id(value)))
+        i = 0
+        while i < num_items:
             # Handle X button to remove item.
-            with imgui_ctx.push_id(f"{repr(value)}#{i}"):
-                if adv_button("X", tooltip=remove_help, is_enabled=can_remove):
+            with push_id(i):
+                if button("X", tooltip=_REMOVE_ITEM_HELP, is_enabled=can_remove):
                     value.pop(i)
                     if i < len(self.item_editors):
                         self.item_editors.pop(i)
                     num_items -= 1
+                    can_remove = num_items > self.min_items
                     changed = True
-                if i >= num_items:
-                    # Since we can remove an item (see above), the list size can change in this loop.
-                    # So we check to be sure.
-                    break
+                    # Next item is now at this same index.
+                    continue
                 # Handle up/down buttons to change order of items.
-                imgui.same_line()
-                if adv_button("/\\", tooltip=up_help, is_enabled=(i > 0)):
+                same_line()
+                if button("/\\", tooltip=_MOVE_ITEM_UP_HELP, is_enabled=(i > 0)):
                     self.swap_items(value, i, i - 1)
                     changed = True
-                imgui.same_line()
-                if adv_button("\\/", tooltip=down_help, is_enabled=(i < num_items - 1)):
+                same_line()
+                if button("\\/", tooltip=_MOVE_ITEM_DOWN_HELP, is_enabled=(i < num_items - 1)):
                     self.swap_items(value, i, i + 1)
                     changed = True
-                imgui.same_line()
+                same_line()
                 # Handle item editor.
                 can_show = True
                 item = value[i]
@@ -117,10 +138,11 @@ class ListEditor(ContainerTypeEditor):
                         imgui.text_colored(Colors.red, f"Can't edit item '{item}'")
                 if self.has_container_items and can_show:
                     imgui.tree_pop()
+            i += 1
+        imgui.pop_id()
         # Handle button to add more itens.
         can_add = (self.max_items is None) or (len(value) < self.max_items)
-        add_help = "Adds a new default item to the list. The item can then be edited."
-        if adv_button("Add Item", tooltip=add_help, is_enabled=can_add):
+        if adv_button("Add Item", tooltip=_ADD_ITEM_HELP, is_enabled=can_add):
             value.append(self.create_new_item())
             changed = True
         return changed, value
@@ -133,8 +155,8 @@ class ListEditor(ContainerTypeEditor):
         ``_editor_<NAME>_add_item(self)`` method, then that method will be called passing this editor instance
         as the sole argument. The method is expected to return the new item to add to the list.
 
-        Otherwise, this method will create a new item to add to the list by calling the constructor of our
-        item-type without any arguments.
+        Otherwise, this method will create a new item to add to the list by calling our ``item_factory`` (by default,
+        the constructor of our item-type without any arguments).
 
         Returns:
             any: new item instance to add to the list being edited. Should be of our expected item-type (``self.value_subtypes[0]``).
@@ -145,8 +167,7 @@ class ListEditor(ContainerTypeEditor):
             if method is not None:
                 return method(self)
 
-        item_type = self.value_subtypes[0]
-        return item_type()
+        return self.item_factory()
 
     def get_item_editor(self, index: int) -> TypeEditor:
         """Gets our internal ItemEditor associated with the given index of the list we're editing.
@@ -166,7 +187,7 @@ class ListEditor(ContainerTypeEditor):
         if 0 <= index < len(self.item_editors):
             return self.item_editors[index]
         for i in range(index - len(self.item_editors) + 1):
-            item_editor = TypeDatabase().get_editor(self.value_subtypes[0], self.item_config)
+            item_editor = _TYPE_DB.get_editor(self.value_subtypes[0], self.item_config)
             self.item_editors.append(item_editor)
         return self.item_editors[index]
 
@@ -179,7 +200,7 @@ class ListEditor(ContainerTypeEditor):
         self.item_editors[j] = editor_i
 
 
-def list_property(min_items: int = 0, max_items: int = None, item_config: dict[str, any] = None):
+def list_property(min_items: int = 0, max_items: int = None, item_config: dict[str, any] = None, item_factory: Callable[[], any] = None):
     """Imgui Property attribute for a LIST type.
 
     Behaves the same way as a property, but includes a ListEditor object for allowing changing this list's items in imgui.
@@ -190,8 +211,10 @@ def list_property(min_items: int = 0, max_items: int = None, item_config: dict[s
         max_items (int, optional): maximum number of items in the list. If the list has more than this, it will be automatically
             trimmed to this size. If None (the default), there is no maximum.
         item_config (dict[str, any], optional): Configuration for the item's TypeEditor. This is passed to the TypeEditor constructor.
+        item_factory (Callable[[], any], optional): Callable (without arguments) used to create new items for the list. Defaults to None,
+            which means the item type's constructor is used.
     """
-    return imgui_property(min_items=min_items, max_items=max_items, item_config=item_config)
+    return imgui_property(min_items=min_items, max_items=max_items, item_config=item_config, item_factory=item_factory)
 
 
 class ObjectEditor(ContainerTypeEditor):
@@ -211,6 +234,9 @@ class ObjectEditor(ContainerTypeEditor):
     of using the ``_editor_get_ignored_properties`` method.
     """
 
+    __slots__ = ("convert_value_to_type", "extra_accepted_input_types", "use_bullet_points", "ignored_properties", "is_nullable", "factory",
+                 "_ignored_set", "_ignored_set_source")
+
     def __init__(self, config: dict):
         super().__init__(config)
         self.convert_value_to_type = config.get("convert_value", False)
@@ -229,6 +255,11 @@ class ObjectEditor(ContainerTypeEditor):
         button will also be shown to allow the user to set the value to None.
         If this is False, the editor will automatically instantiate a new object to change a None value.
         """
+        self.factory: Callable[[], any] = config.get("factory") or self.value_type
+        """Callable (without arguments) used to instantiate new objects (see ``self.instantiate_object()``). Defaults to our value-type
+        itself. Can be used to create objects more cheaply, such as copying a prototype object."""
+        self._ignored_set: frozenset[str] = None
+        self._ignored_set_source: list[str] = None
 
     def draw_value_editor(self, value):
         changed = False
@@ -245,9 +276,10 @@ class ObjectEditor(ContainerTypeEditor):
             changed = True
         props = get_all_renderable_properties(type(value))
         ignored_props = self.get_ignored_properties(value)
+        use_bullet_points = self.use_bullet_points
         for name, prop in props.items():
             if name not in ignored_props:
-                if self.use_bullet_points:
+                if use_bullet_points:
                     imgui.bullet()
                     imgui.same_line()
                 changed = prop.render_editor(value) or changed
@@ -264,29 +296,33 @@ class ObjectEditor(ContainerTypeEditor):
 
         return changed, value
 
-    def get_ignored_properties(self, obj) -> list[str]:
+    def get_ignored_properties(self, obj) -> list[str] | frozenset[str]:
         """Gets the ignored properties of the object we're editing.
 
         This method is called when this editor is drawn, and it does the following logic to
         determine the ignored properties:
-        * If the editor's ``ignored_properties`` attribute (from the editor config) is not None, it returns it.
-        By default, this attribute is None.
+        * If the editor's ``ignored_properties`` attribute (from the editor config) is not None, it returns it as a frozenset
+        (converted once, and again only if the attribute is replaced). By default, this attribute is None.
         * If the object we're editing has a ``_editor_get_ignored_properties`` method, it is called passing `self`
         (this editor object) as the only argument. The method's return value is expected to be the list of ignored
         properties. If this return value is falsy, an empty list is returned.
         * If none of the above conditions are met, we default to returning an empty list.
 
         Returns:
-            list[str]: list of property names to ignore when rendering the editor.
+            list[str] | frozenset[str]: list (or set) of property names to ignore when rendering the editor.
         """
-        if self.ignored_properties is None:
+        ignored = self.ignored_properties
+        if ignored is None:
             updater_method_name = "_editor_get_ignored_properties"
             method = getattr(obj, updater_method_name, None)
             if method is not None:
                 return method(self) or []
             else:
                 return []
-        return self.ignored_properties
+        if ignored is not self._ignored_set_source:
+            self._ignored_set = frozenset(ignored)
+            self._ignored_set_source = ignored
+        return self._ignored_set
 
     def instantiate_object(self):
         """Instantiates a new object of the type represented by this editor, in order to set it as the property being
@@ -296,7 +332,8 @@ class ObjectEditor(ContainerTypeEditor):
         ``_editor_<NAME>_instantiate(self)`` method, then that method will be called passing this editor instance
         as the sole argument. The method is expected to return the new object instance.
 
-        Otherwise, this method will instantiate a new object by calling the constructor of our value-type without any arguments.
+        Otherwise, this method will instantiate a new object by calling our ``factory`` (by default, the constructor of our
+        value-type without any arguments).
 
         Returns:
             any: new object instance. Should be of our expected value-type (``self.value_type``).
@@ -307,10 +344,11 @@ class ObjectEditor(ContainerTypeEditor):
             if method is not None:
                 return method(self)
 
-        return self.value_type()
+        return self.factory()
 
 
-def obj_property(use_bullet_points: bool = False, ignored_properties: list[str] = None, is_nullable: bool = False):
+def obj_property(use_bullet_points: bool = False, ignored_properties: list[str] = None, is_nullable: bool = False,
+                 factory: Callable[[], any] = None):
     """Imgui Property attribute for a custom-object type. These can be any types that are configured to being edited by a ObjectEditor.
 
     Behaves the same way as a @property, but includes a ListEditor object for allowing changing this list's items in imgui.
@@ -321,5 +359,8 @@ def obj_property(use_bullet_points: bool = False, ignored_properties: list[str]
             properties won't be displayed/edited by this Editor. Defaults to None.
         is_nullable (bool, optional): If True, the property being edited by this Editor can have a value of None, and can be set as None by the user.
             Defaults to False.
+        factory (Callable[[], any], optional): Callable (without arguments) used to instantiate new objects for this property. Defaults to None,
+            which means the object type's constructor is used.
     """
-    return imgui_property(use_bullet_points=use_bullet_points, ignored_properties=ignored_properties, is_nullable=is_nullable)
+    return imgui_property(use_bullet_points=use_bullet_points, ignored_properties=ignored_properties, is_nullable=is_nullable,
+                          factory=factory)
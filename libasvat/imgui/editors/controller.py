@@ -1,26 +1,33 @@
 import copy
 import click
-from libasvat.utils import get_all_properties
+import weakref
+from typing import Callable
+from collections.abc import Mapping
 from libasvat.imgui.general import adv_button
 from libasvat.imgui.editors.database import TypeDatabase
 from libasvat.imgui.editors.editor import ImguiProperty
 from imgui_bundle import imgui, imgui_ctx
 
+_render_plans: weakref.WeakKeyDictionary[type, tuple[tuple[str, Callable[[object], bool]], ...]] = weakref.WeakKeyDictionary()
+"""Cache of ``(name, prop.render_editor)`` pairs of all renderable properties of each class, used by ``render_all_properties()``."""
 
-def get_all_renderable_properties(cls: type) -> dict[str, ImguiProperty]:
+
+def get_all_renderable_properties(cls: type) -> Mapping[str, ImguiProperty]:
     """Gets all "Imgui Properties" of a class. This includes properties of parent classes.
 
     Imgui Properties are properties with an associated ImguiTypeEditor object created with the
     ``@imgui_property(editor)`` and related decorators.
 
+    Since this is used each frame to render objects, the properties are cached per class (see ``ImguiProperty.get_all_from_class()``).
+
     Args:
         cls (type): the class to get all imgui properties from.
 
     Returns:
-        dict[str,ImguiProperty]: a "property name" => "ImguiProperty object" dict with all imgui properties.
+        Mapping[str,ImguiProperty]: a read-only "property name" => "ImguiProperty object" mapping with all imgui properties.
         All editors returned by this will have had their "parent properties" set accordingly.
     """
-    return get_all_properties(cls, ImguiProperty)
+    return ImguiProperty.get_all_from_class(cls)
 
 
 def render_all_properties(obj, ignored_props: set[str] = None):
@@ -38,11 +45,15 @@ def render_all_properties(obj, ignored_props: set[str] = None):
     Returns:
         bool: If any property in the object was changed.
     """
-    props = get_all_renderable_properties(type(obj))
+    cls = type(obj)
+    plan = _render_plans.get(cls)
+    if plan is None:
+        props = get_all_renderable_properties(cls)
+        plan = _render_plans[cls] = tuple((name, prop.render_editor) for name, prop in props.items())
     changed = False
-    for name, prop in props.items():
+    for name, render_editor in plan:
         if (ignored_props is None) or (name not in ignored_props):
-            changed = prop.render_editor(obj) or changed
+            changed = render_editor(obj) or changed
     return changed
 
 
@@ -4,6 +4,10 @@ import libasvat.command_utils as cmd_utils
 from libasvat.imgui.colors import Color
 from libasvat.imgui.editors.editor import TypeEditor, UnionEditor, NoopEditor
 
+_get_origin = typing.get_origin
+_get_args = typing.get_args
+_UnionType = types.UnionType
+
 
 class TypeDatabase(metaclass=cmd_utils.Singleton):
     """Database of Python Types and their TypeEditors for visualization and editing of values in IMGUI.
@@ -13,7 +17,13 @@ class TypeDatabase(metaclass=cmd_utils.Singleton):
 
     def __init__(self):
         self._types: dict[type, type[TypeEditor]] = {}
-        self._creatable_types: dict[type, bool] = {}
+        self._type_configs: dict[type, dict[str, any]] = {}
+        """Extra editor config for registered types, merged over the config given to ``get_editor()``. See ``add_type_editor()``."""
+        self._creatable_types: dict[type, None] = {}
+        """Types registered as creatable. Used as an ordered set, keeping the registration order."""
+        self._resolution_cache: dict[type, tuple[type[TypeEditor] | None, type, tuple[type, ...], dict[str, any] | None]] = {}
+        """Cache of value-type resolutions done by ``get_editor()``: value_type -> (editor class, actual type, subtypes, type config).
+        Union type-hints aren't cached."""
 
     def get_editor(self, value_type: type, config: dict[str, any] = None):
         """Creates a new TypeEditor instance for the given value type with the appropriate available TypeEditor class.
@@ -32,10 +42,47 @@ class TypeDatabase(metaclass=cmd_utils.Singleton):
             TypeEditor: A TypeEditor instance that can edit the given value_type, or None
             if no editor is registered for that type (or any of its parent classes).
         """
-        actual_type = typing.get_origin(value_type) or value_type
-        subtypes = typing.get_args(value_type)
-        is_union = actual_type is types.UnionType
+        origin = _get_origin(value_type)
+        if origin is _UnionType or origin is typing.Union:
+            # Unions compare and hash equal regardless of argument order (and ``Optional[T] == T | None``), so a cached
+            # resolution could come from a different hint. They're cheap to resolve, so they aren't cached.
+            resolution = self._resolve_type(value_type)
+        else:
+            try:
+                resolution = self._resolution_cache.get(value_type)
+            except TypeError:
+                # Unhashable type-hint (such as ``Annotated`` with unhashable metadata): can't be cached.
+                resolution = self._resolve_type(value_type)
+            else:
+                if resolution is None:
+                    resolution = self._resolution_cache[value_type] = self._resolve_type(value_type)
+        editor_cls, actual_type, subtypes, type_config = resolution
+        if editor_cls:
+            if config is None:
+                config = {}
+            if type_config:
+                config = config | type_config
+            config["original_type"] = value_type
+            config["value_type"] = actual_type
+            config["value_subtypes"] = subtypes
+            return editor_cls(config)
+
+    def _resolve_type(self, value_type: type):
+        """Resolves the given value type to the TypeEditor class that can edit it. See ``get_editor()``.
+
+        Args:
+            value_type (type): The type to resolve.
+
+        Returns:
+            tuple[type[TypeEditor], type, tuple[type, ...], dict]: a ``(editor class, actual type, subtypes, type config)`` tuple.
+            The editor class is None if no editor is registered for the type. The type config is the extra config
+            registered with the editor class, if any.
+        """
+        actual_type = _get_origin(value_type) or value_type
+        subtypes = _get_args(value_type)
+        is_union = actual_type is _UnionType
         editor_cls = None
+        type_config = None
         if is_union:
             editor_cls = UnionEditor
             actual_type = value_type  # UnionEditor needs original_type==value_type, being the union itself.
@@ -43,24 +90,30 @@ class TypeDatabase(metaclass=cmd_utils.Singleton):
             for cls in actual_type.mro():
                 if cls in self._types:
                     editor_cls = self._types[cls]
+                    type_config = self._type_configs.get(cls)
                     break
-        if editor_cls:
-            config = config or {}
-            config["original_type"] = value_type
-            config["value_type"] = actual_type
-            config["value_subtypes"] = subtypes
-            return editor_cls(config)
+        return editor_cls, actual_type, subtypes, type_config
 
-    def add_type_editor(self, cls: type, editor_class: type['TypeEditor'], is_creatable=True):
+    def add_type_editor(self, cls: type, editor_class: type['TypeEditor'], is_creatable=True, config: dict[str, any] = None):
         """Adds a new TypeEditor class in this database associated with the given type.
 
         Args:
             cls (type): The value-type that the given Editor class can edit.
             editor_class (type[TypeEditor]): The TypeEditor class being added, that can edit the given ``cls`` type.
             is_creatable (bool, optional): If this type, with the given editor class, will be creatable via editor. Defaults to True.
+            config (dict[str, any], optional): Extra editor config for this type. Editors created for this type will have these
+                values set in their config, overriding the ones from the config given to ``get_editor()``. Defaults to None.
         """
         self._types[cls] = editor_class
-        self._creatable_types[cls] = is_creatable
+        if config:
+            self._type_configs[cls] = config
+        else:
+            self._type_configs.pop(cls, None)
+        if is_creatable:
+            self._creatable_types[cls] = None
+        else:
+            self._creatable_types.pop(cls, None)
+        self._resolution_cache.clear()
 
     def get_creatable_types(self):
         """Gets the list of available types in the database that can be created simply with their editors.
@@ -70,7 +123,7 @@ class TypeDatabase(metaclass=cmd_utils.Singleton):
         Returns:
             list[type]: list of types with proper registered editors.
         """
-        return [cls for cls, is_creatable in self._creatable_types.items() if is_creatable]
+        return list(self._creatable_types)
 
     @classmethod
     def register_editor_for_type(cls, type_cls: type, is_creatable=True):
@@ -88,8 +141,7 @@ class TypeDatabase(metaclass=cmd_utils.Singleton):
             is_creatable (bool, optional): If this type, with the given editor class, will be creatable via editor. Defaults to True.
         """
         def decorator(editor_cls):
-            db = cls()
-            db.add_type_editor(type_cls, editor_cls, is_creatable)
+            _TYPE_DB.add_type_editor(type_cls, editor_cls, is_creatable)
             return editor_cls
         return decorator
 
@@ -108,12 +160,7 @@ class TypeDatabase(metaclass=cmd_utils.Singleton):
             color (Color): Type color to set in the NoopEditor.
         """
         def decorator(type_cls):
-            class SpecificNoopEditor(NoopEditor):
-                def __init__(self, config: dict):
-                    super().__init__(config)
-                    self.color = color
-            db = cls()
-            db.add_type_editor(type_cls, SpecificNoopEditor, False)
+            _TYPE_DB.add_type_editor(type_cls, NoopEditor, False, {"color": color})
             return type_cls
         return decorator
 
@@ -126,7 +173,10 @@ class TypeDatabase(metaclass=cmd_utils.Singleton):
             is_creatable (bool, optional): If this type, with the given editor class, will be creatable via editor. Defaults to True.
         """
         def decorator(type_cls):
-            db = cls()
-            db.add_type_editor(type_cls, editor_cls, is_creatable)
+            _TYPE_DB.add_type_editor(type_cls, editor_cls, is_creatable)
             return type_cls
         return decorator
+
+
+_TYPE_DB = TypeDatabase()
+"""The TypeDatabase singleton instance. Used internally to skip the Singleton metaclass call on each access."""
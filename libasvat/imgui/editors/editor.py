@@ -1,10 +1,12 @@
 import types
 import typing
 import inspect
+import weakref
+import functools
 from contextlib import contextmanager
 from libasvat.imgui.colors import Colors, Color
 from libasvat.imgui.general import drop_down
-from libasvat.utils import AdvProperty, adv_property
+from libasvat.utils import AdvProperty, adv_property, get_all_properties
 from imgui_bundle import imgui
 
 
@@ -15,13 +17,43 @@ class ImguiProperty(AdvProperty):
     is based on this property's metadata.
     """
 
+    _class_properties: weakref.WeakKeyDictionary[type, dict[type, types.MappingProxyType[str, 'ImguiProperty']]] = weakref.WeakKeyDictionary()
+    """Cache of ``get_all_from_class()``: owner class -> {property class -> properties}."""
+
     @property
-    def editors(self) -> dict[object, 'TypeEditor']:
+    def editors(self) -> weakref.WeakKeyDictionary[object, 'TypeEditor']:
         """Internal mapping of objects to the TypeEditors that this property has created.
-        The objects are the instances of the class that owns this property."""
-        objects = getattr(self, "_editors", {})
-        self._editors = objects
-        return objects
+        The objects are the instances of the class that owns this property.
+
+        Objects are weakly referenced, so their editors are released along with them. Thus objects need to support weak references,
+        which is the default for regular python classes (but not for those with ``__slots__`` without ``__weakref__``)."""
+        try:
+            return self._editors
+        except AttributeError:
+            self._editors = weakref.WeakKeyDictionary()
+            return self._editors
+
+    @classmethod
+    def get_all_from_class(cls, owner: type) -> types.MappingProxyType[str, 'ImguiProperty']:
+        """Gets all properties of this property class (and subclasses) from the given owner class, including properties of parent classes.
+
+        This is the same as ``get_all_properties(owner, cls)``, but the result is cached per owner class, since this is usually
+        called each frame to render the properties of objects. So properties added to a class (or its parents) after it
+        was first used here won't show up.
+
+        Args:
+            owner (type): the class to get the properties from.
+
+        Returns:
+            MappingProxyType[str, ImguiProperty]: a read-only "property name" => "property object" mapping with all properties.
+        """
+        by_prop_class = cls._class_properties.get(owner)
+        if by_prop_class is None:
+            by_prop_class = ImguiProperty._class_properties[owner] = {}
+        props = by_prop_class.get(cls)
+        if props is None:
+            props = by_prop_class[cls] = types.MappingProxyType(get_all_properties(owner, cls))
+        return props
 
     def get_value_from_obj(self, obj, owner: type | None = None):
         """Gets the internal value of this property in the given OBJ.
@@ -74,9 +106,8 @@ class ImguiProperty(AdvProperty):
             * The actual type of the value returned by the property, if the getter has no return type annotation and given ``obj`` as valid.
             This "actual type" might not be the desired/expected type of the property. For example, could be a class of some kind but value was None.
         """
-        sig = inspect.signature(self.fget)
-        cls = sig.return_annotation
-        if cls == sig.empty:
+        cls = self._get_return_annotation()
+        if cls is inspect.Signature.empty:
             if "value_type" in self.metadata:
                 return self.metadata["value_type"]
             elif obj is not None:
@@ -96,23 +127,44 @@ class ImguiProperty(AdvProperty):
         Returns:
             tuple[type, ...]: a tuple of subtypes. This tuple will be empty if there are no subtypes.
         """
-        sig = inspect.signature(self.fget)
-        cls = sig.return_annotation
-        if cls == sig.empty:
-            return tuple()
-        return typing.get_args(cls)
+        try:
+            return self._value_subtypes
+        except AttributeError:
+            cls = self._get_return_annotation()
+            if cls is inspect.Signature.empty:
+                self._value_subtypes = tuple()
+            else:
+                self._value_subtypes = typing.get_args(cls)
+            return self._value_subtypes
+
+    def _get_return_annotation(self):
+        """Gets the return type annotation of this property's getter (``inspect.Signature.empty`` if it has none).
+
+        Inspecting the getter's signature is costly, and editors query the property's type often. Since the getter of
+        a property can't be changed, the annotation is cached in this property. The getter's inspection itself is also
+        cached (see ``_inspect_return_annotation()``), so properties sharing the same getter only inspect it once.
+        """
+        try:
+            return self._return_annotation
+        except AttributeError:
+            self._return_annotation = _inspect_return_annotation(self.fget)
+            return self._return_annotation
 
     def get_editor_config(self):
         """Gets the TypeEditor config dict used to initialize editors for this property, for
         the given object (property owner).
 
         Returns:
-            dict: the config dict to pass to a TypeEditor's constructor.
+            dict: the config dict to pass to a TypeEditor's constructor. This is a new dict, which the caller may change.
         """
-        config = self.metadata.copy()
-        if "doc" not in config:
-            config["doc"] = self.__doc__ or ""
-        return config
+        try:
+            base_config = self._base_editor_config
+        except AttributeError:
+            base_config = self.metadata
+            if "doc" not in base_config:
+                base_config = dict(base_config, doc=self.__doc__ or "")
+            self._base_editor_config = base_config
+        return base_config.copy()
 
     def get_editor(self, obj):
         """Gets the TypeEditor instance for the given object, for editing this property's value.
@@ -132,8 +184,7 @@ class ImguiProperty(AdvProperty):
         """
         editor: TypeEditor = self.editors.get(obj, None)
         if editor is None:
-            from libasvat.imgui.editors.database import TypeDatabase
-            database = TypeDatabase()
+            from libasvat.imgui.editors.database import _TYPE_DB as database
             config = self.get_editor_config()
             editor = database.get_editor(self.get_value_type(obj), config)
             self.editors[obj] = editor
@@ -160,6 +211,15 @@ class ImguiProperty(AdvProperty):
         return False
 
 
+@functools.lru_cache(maxsize=1024)
+def _inspect_return_annotation(func: typing.Callable):
+    """Gets the return type annotation of the given function, or ``inspect.Signature.empty`` if it has none.
+
+    The signature inspection is cached for each function object.
+    """
+    return inspect.signature(func).return_annotation
+
+
 def imgui_property(**kwargs):
     """Imgui Property attribute. Can be used to create imgui properties the same way as a regular @property.
 
@@ -199,8 +259,33 @@ class TypeEditor:
 
     Other ``@<type>_property(**args)`` decorators exist to help setting up a imgui-property by having documentation for
     the metadata of that type.
+
+    Editors use ``__slots__``, since there's usually one editor per object and property. Subclasses that don't
+    define their own ``__slots__`` still work as usual, with a ``__dict__``.
     """
 
+    __slots__ = ("original_type", "value_type", "value_subtypes", "attr_doc", "add_tooltip_after_value", "color",
+                 "use_pretty_name", "_current_obj", "_current_name", "_imgui_id", "_header_labels")
+
+    extra_accepted_input_types: type | tuple[type] | types.UnionType = None
+    """Extra types that this editor, when used as a Input DataPin in Node Systems, can accept as value.
+    Useful for types that can accept (or convert) other values to its type.
+
+    These extra types can be defined the same way as the ``class_or_tuple`` param for ``issubclass(type, class_or_tuple)``.
+    Which means, it can be a single type, a UnionType (``A | B``) or a tuple of types.
+
+    This is usually used together with ``self.convert_value_to_type`` to ensure the input value is converted
+    to this type.
+
+    This is a class attribute, so subclasses define their value at class level. Subclasses that need to set it
+    per-instance (such as from their config) should declare it in their ``__slots__``.
+    """
+    convert_value_to_type: bool = False
+    """If the value we receive should be converted to our ``value_type`` before using. This is done using
+    ``self.value_type(value)``, like most basic python types accept.
+
+    Like ``extra_accepted_input_types``, this is a class attribute."""
+
     def __init__(self, config: dict):
         self.original_type: type = config.get("original_type")
         """The original type used to create this Editor instance. This might be any kind of type-hint, such as
@@ -223,19 +308,6 @@ class TypeEditor:
         """If true, this will add ``self.attr_doc`` as a tooltip for the last imgui control drawn."""
         self.color: Color = Color(0.2, 0.2, 0.6, 1)
         """Color of this type. Mostly used by DataPins of this type in Node Systems."""
-        self.extra_accepted_input_types: type | tuple[type] | types.UnionType = None
-        """Extra types that this editor, when used as a Input DataPin in Node Systems, can accept as value.
-        Useful for types that can accept (or convert) other values to its type.
-
-        These extra types can be defined the same way as the ``class_or_tuple`` param for ``issubclass(type, class_or_tuple)``.
-        Which means, it can be a single type, a UnionType (``A | B``) or a tuple of types.
-
-        This is usually used together with ``self.convert_value_to_type`` to ensure the input value is converted
-        to this type.
-        """
-        self.convert_value_to_type: bool = False
-        """If the value we receive should be converted to our ``value_type`` before using. This is done using
-        ``self.value_type(value)``, like most basic python types accept."""
         self.use_pretty_name: bool = config.get("use_pretty_name", True)
         """If the name of the property being edited should be shown as a "pretty name" (with spaces and capitalized)."""
         self._current_obj: any = None
@@ -252,6 +324,10 @@ class TypeEditor:
         ``self.render_property(obj, name)`` is an example of a method that will set this attribute during its execution.
         See ``self.editing_obj_prop()``.
         """
+        self._imgui_id: str = str(id(self))
+        """Imgui ID pushed by ``self.render_value_editor()``. It's constant for this editor, so only built once."""
+        self._header_labels: dict[str, tuple[bool, str]] = {}
+        """Cache of header labels drawn by ``self.draw_header()``: property name -> (use_pretty_name, label)."""
 
     def type_name(self):
         """Gets a human readable name of the type represented by this editor."""
@@ -285,7 +361,6 @@ class TypeEditor:
             changed = False
             if can_draw_value:
                 value = getattr(obj, name)
-                value = self._check_value_type(value)
                 changed, new_value = self.render_value_editor(value)
                 if changed:
                     setattr(obj, name, new_value)
@@ -314,8 +389,12 @@ class TypeEditor:
             bool: if True, ``self.render_property()`` will draw the value-editor for this property. Otherwise it'll
             skip the value, only drawing this header.
         """
-        imgui.text(f"{self.get_name_to_show(name)}:")
-        imgui.set_item_tooltip(self.attr_doc)
+        cached = self._header_labels.get(name)
+        if cached is None or cached[0] != self.use_pretty_name:
+            cached = self._header_labels[name] = (self.use_pretty_name, f"{self.get_name_to_show(name)}:")
+        imgui.text(cached[1])
+        if self.attr_doc:
+            imgui.set_item_tooltip(self.attr_doc)
         imgui.same_line()
         return True
 
@@ -346,7 +425,7 @@ class TypeEditor:
             the name: replacing underscores with spaces and capitalizing the first letter in all words.
         """
         if self.use_pretty_name:
-            return " ".join(word.capitalize() for word in name.split("_"))
+            return _get_pretty_name(name)
         return name
 
     def render_value_editor[T](self, value: T) -> tuple[bool, T]:
@@ -365,10 +444,10 @@ class TypeEditor:
         Returns:
             tuple[bool, T]: returns a ``(changed, new_value)`` tuple.
         """
-        imgui.push_id(f"{repr(self)}")
+        imgui.push_id(self._imgui_id)
         value = self._check_value_type(value)
         changed, new_value = self.draw_value_editor(value)
-        if self.add_tooltip_after_value:
+        if self.add_tooltip_after_value and self.attr_doc:
             imgui.set_item_tooltip(self.attr_doc)
         imgui.pop_id()
         return changed, new_value
@@ -390,14 +469,25 @@ class TypeEditor:
         """Calls a optional ``<OBJ>._update_<NAME>_editor(self)`` method from the given object,
         with the purpose of dynamically updating this editor's attributes before drawing the editor itself.
 
+        The updater method needs to be defined in the object's class. Whether the class has it is checked only
+        once and cached, so the common case of classes without updaters costs a single dict lookup.
+
         Args:
             obj (any): the object being updated
             name (str): the name of the attribute in object we're editing.
         """
-        updater_method_name = f"_update_{name}_editor"
-        method = getattr(obj, updater_method_name, None)
-        if method is not None:
-            method(self)
+        cls = type(obj)
+        class_names = _updater_method_names.get(cls)
+        if class_names is None:
+            class_names = _updater_method_names[cls] = {}
+        updater_method_name = class_names.get(name, "")
+        if updater_method_name == "":
+            updater_method_name = f"_update_{name}_editor"
+            if not hasattr(cls, updater_method_name):
+                updater_method_name = None
+            class_names[name] = updater_method_name
+        if updater_method_name is not None:
+            getattr(obj, updater_method_name)(self)
 
     def _check_value_type[T](self, value: T) -> T:
         """Checks and possibly converts the given value to our value-type if required.
@@ -411,18 +501,20 @@ class TypeEditor:
             If conversion is required but fails with a TypeError and value is None, will return ``self.value_type()`` to create a default
             value of our type, otherwise will (re)raise the error from the conversion.
         """
-        if self.convert_value_to_type and self.value_type and not isinstance(value, self.value_type):
-            try:
-                value = self.value_type(value)
-            except TypeError:
-                if value is None:
-                    # Common type conversion can fail if value=None. So just try to generate a default value.
-                    # Most basic types in python (int, float, str, bool...) follow this behavior.
-                    value = self.value_type()
-                else:
-                    # If conversion failed and type wasn't None, then we have a real error on our hands. Re-raise the exception to see it.
-                    raise
-        return value
+        if not self.convert_value_to_type:
+            return value
+        value_type = self.value_type
+        if not value_type or isinstance(value, value_type):
+            return value
+        try:
+            return value_type(value)
+        except TypeError:
+            if value is None:
+                # Common type conversion can fail if value=None. So just try to generate a default value.
+                # Most basic types in python (int, float, str, bool...) follow this behavior.
+                return value_type()
+            # If conversion failed and type wasn't None, then we have a real error on our hands. Re-raise the exception to see it.
+            raise
 
     @contextmanager
     def editing_obj_prop(self, obj, name: str):
@@ -450,12 +542,33 @@ class TypeEditor:
         self._current_name = None
 
 
+_updater_method_names: weakref.WeakKeyDictionary[type, dict[str, str | None]] = weakref.WeakKeyDictionary()
+"""Cache of ``object class -> {property name -> updater method name}`` used by ``TypeEditor.update_from_obj()``.
+The name is None when the class has no updater method for that property. Classes are weakly referenced, so
+classes created dynamically (and later discarded) don't stay alive in this cache."""
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_pretty_name(name: str):
+    """Converts the given name to a "pretty" name, replacing underscores with spaces and capitalizing all words.
+
+    Editors convert their property names every frame, so the results are cached.
+    """
+    return " ".join(word.capitalize() for word in name.split("_"))
+
+
 class NoopEditor(TypeEditor):
     """Imgui TypeEditor for a type that can't be edited.
 
     This allows editors to exist, and thus provide some other features (such as type color), for types that can't be edited.
     """
 
+    __slots__ = ()
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.color = config.get("color", self.color)
+
     def draw_value_editor[T](self, value: T) -> tuple[bool, T]:
         imgui.text_colored(Colors.yellow, f"Can't edit object '{value}'")
         return False, value
@@ -471,7 +584,8 @@ class UnionEditor(TypeEditor):
 
     Internally, we use other TypeEditors instances for each specific sub-types. The UnionEditor instance
     and its internal "sub-editors" share the same configuration dict. UnionEditor color is the mean color
-    of all sub-editors.
+    of all sub-editors. Since the color and the sub-type names (shown to the user to select the type) come from
+    the sub-editors, these are all created when the UnionEditor is created.
 
     Note! Since this allows changing the type of the value between any of the sub-types, it is expected that
     the sub-types are convertible between themselves.
@@ -480,10 +594,11 @@ class UnionEditor(TypeEditor):
     the TypeDatabase will manually always return a instance of this editor of any union-type that is given.
     """
 
+    __slots__ = ("subeditors", "_subtype_names", "_default_subtype", "_type_to_name")
+
     def __init__(self, config: dict):
         super().__init__(config)
-        from libasvat.imgui.editors.database import TypeDatabase
-        database = TypeDatabase()
+        from libasvat.imgui.editors.database import _TYPE_DB as database
         self.subeditors: dict[str, TypeEditor] = {}
         colors = []
         for subtype in self.value_subtypes:
@@ -491,6 +606,12 @@ class UnionEditor(TypeEditor):
             self.subeditors[subeditor.type_name()] = subeditor
             colors.append(subeditor.color)
         self.color = Colors.mean_color(colors)
+        self._subtype_names: tuple[str, ...] = tuple(self.subeditors.keys())
+        """Names of our sub-types (keys of ``self.subeditors``), in order."""
+        self._default_subtype: str = self._subtype_names[0]
+        """Name of the sub-type used for values that don't match any of our sub-types."""
+        self._type_to_name: dict[type, str] = {}
+        """Cache of ``type(value) -> sub-type name``, filled in by ``self.get_current_value_type()``."""
 
     def type_name(self):
         # When creating a UnionEditor, original_type and value_type should be the same: the union-type object.
@@ -498,11 +619,10 @@ class UnionEditor(TypeEditor):
 
     def draw_value_editor[T](self, value: T) -> tuple[bool, T]:
         # Get current subeditor for the given value
-        subtypes = list(self.subeditors.keys())
         selected_type = self.get_current_value_type(value)
         # Allow used to change the value's type.
         doc = "Type to use with this value"
-        changed_type, selected_type = drop_down(selected_type, subtypes, default_doc=doc, drop_flags=imgui.ComboFlags_.width_fit_preview)
+        changed_type, selected_type = drop_down(selected_type, self._subtype_names, default_doc=doc, drop_flags=imgui.ComboFlags_.width_fit_preview)
         imgui.same_line()
         # Render sub-editor
         subeditor = self.subeditors[selected_type]
@@ -524,7 +644,14 @@ class UnionEditor(TypeEditor):
         Returns:
             str: type-name (from our possible subtype names) that matches the given value's type.
         """
-        for name, subeditor in self.subeditors.items():
+        value_cls = type(value)
+        name = self._type_to_name.get(value_cls)
+        if name is not None:
+            return name
+        name = self._default_subtype
+        for subname, subeditor in self.subeditors.items():
             if isinstance(value, subeditor.value_type):
-                return name
-        return list(self.subeditors.keys())[0]  # defaults to first subtype
+                name = subname
+                break
+        self._type_to_name[value_cls] = name
+        return name
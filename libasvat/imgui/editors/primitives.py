@@ -6,11 +6,20 @@ from libasvat.imgui.editors.editor import TypeEditor, imgui_property
 from imgui_bundle import imgui
 from enum import Enum
 
+_NO_TOOLTIPS_DOC = object()
+"""Initial value of ``Vector2Editor._tooltips_doc``, so the tooltips are built even when ``attr_doc`` is None."""
+
 
 @TypeDatabase.register_editor_for_type(str)
 class StringEditor(TypeEditor):
     """Imgui TypeEditor for editing a STRING value."""
 
+    __slots__ = ("flags", "options", "docs", "option_flags", "enforce_options", "multiline", "_last_value", "_last_num_lines",
+                 "_docs_map", "_docs_map_source")
+
+    extra_accepted_input_types = object
+    convert_value_to_type = True
+
     def __init__(self, config: dict):
         super().__init__(config)
         self.flags: imgui.InputTextFlags_ = config.get("flags", imgui.InputTextFlags_.none)
@@ -22,22 +31,46 @@ class StringEditor(TypeEditor):
         self.add_tooltip_after_value = self.options is None
         self.multiline: bool = config.get("multiline", False)
         self.color = Colors.magenta
-        self.extra_accepted_input_types = object
-        self.convert_value_to_type = True
+        self._last_value: str = None
+        self._last_num_lines: int = 1
+        self._docs_map: dict[str, str] | None = None
+        self._docs_map_source: tuple[list[str], list[str] | dict[str, str] | None] = None
 
     def draw_value_editor(self, value: str) -> tuple[bool, str]:
         if self.options is None:
             if value is None:
                 value = ""
-            num_lines = value.count("\n") + 1
+            if value is not self._last_value:
+                # Strings are immutable, so we only need to recount lines when we get a different string object.
+                self._last_value = value
+                self._last_num_lines = value.count("\n") + 1
+            num_lines = self._last_num_lines
             if self.multiline or num_lines > 1:
                 size = (0, num_lines * imgui.get_text_line_height_with_spacing())
                 changed, new_value = imgui.input_text_multiline("##", value, size, flags=self.flags)
             else:
                 changed, new_value = imgui.input_text("##", value, flags=self.flags)
+            if not changed:
+                return False, value
             return changed, new_value.replace("\\n", "\n")
         else:
-            return drop_down(value, self.options, self.docs, default_doc=self.attr_doc, enforce=self.enforce_options, item_flags=self.option_flags)
+            return drop_down(value, self.options, self._get_docs_map(), default_doc=self.attr_doc, enforce=self.enforce_options,
+                             item_flags=self.option_flags)
+
+    def _get_docs_map(self):
+        """Gets our ``self.docs`` as a ``{option: doc}`` dict, to pass to ``drop_down()``.
+
+        If the docs are a list, it's converted to a dict matching our ``self.options``. The converted dict is cached
+        until our options or docs are changed.
+        """
+        source = self._docs_map_source
+        if source is None or source[0] is not self.options or source[1] is not self.docs:
+            if isinstance(self.docs, list):
+                self._docs_map = dict(zip(self.options, self.docs))
+            else:
+                self._docs_map = self.docs
+            self._docs_map_source = (self.options, self.docs)
+        return self._docs_map
 
 
 def string_property(flags: imgui.InputTextFlags_ = 0, options: list[str] = None, docs: list | dict = None, option_flags: imgui.SelectableFlags_ = 0):
@@ -61,6 +94,8 @@ def string_property(flags: imgui.InputTextFlags_ = 0, options: list[str] = None,
 class EnumEditor(TypeEditor):
     """Imgui TypeEditor for editing a ENUM value."""
 
+    __slots__ = ("flags",)
+
     def __init__(self, config: dict):
         super().__init__(config)
         self.add_tooltip_after_value = False
@@ -86,11 +121,14 @@ def enum_property(flags: imgui.SelectableFlags_ = 0):
 class BoolEditor(TypeEditor):
     """Imgui TypeEditor for editing a BOOLEAN value."""
 
+    __slots__ = ()
+
+    extra_accepted_input_types = object
+    convert_value_to_type = True
+
     def __init__(self, config: dict):
         super().__init__(config)
         self.color = Colors.red
-        self.extra_accepted_input_types = object
-        self.convert_value_to_type = True
 
     def draw_value_editor(self, value: bool):
         return imgui.checkbox("##", value)
@@ -104,49 +142,77 @@ def bool_property():
     return imgui_property()
 
 
-@TypeDatabase.register_editor_for_type(float)
-class FloatEditor(TypeEditor):
-    """Imgui TypeEditor for editing a FLOAT value."""
+class _NumericEditor(TypeEditor):
+    """Base TypeEditor for editing a numeric value (FLOAT or INTEGER) with a slider or drag control.
+
+    Subclasses define, as class attributes, the imgui controls used for their type and the default values for their config.
+    """
+
+    __slots__ = ("is_slider", "speed", "min", "max", "format", "flags")
+
+    convert_value_to_type = True
+    _slider_control = None
+    """imgui function for the slider control of our type (``imgui.slider_<type>``). Should be set as a staticmethod."""
+    _drag_control = None
+    """imgui function for the drag control of our type (``imgui.drag_<type>``). Should be set as a staticmethod."""
+    _default_value: float | int = 0
+    """Value to use when editing a None value, and the default of our ``min``/``max`` config."""
+    _default_format: str = "%d"
+    """Default display format of our control."""
 
     def __init__(self, config: dict):
         """
         Args:
-            min (float, optional): Minimum allowed value for this float property. Defaults to 0.0.
-            max (float, optional): Maximum allowed value for this float property. Defaults to 0.0. If MIN >= MAX then we have no bounds.
-            format (str, optional): Text format of the value to decorate the control with. Defaults to "%.2f". Apparently this needs to be a valid
-                python format, otherwise the float control wont work properly.
+            min (float | int, optional): Minimum allowed value for this property. Defaults to 0. If MIN >= MAX then we have no bounds.
+            max (float | int, optional): Maximum allowed value for this property. Defaults to 0. If MIN >= MAX then we have no bounds.
+            format (str, optional): Text format of the value to decorate the control with. Defaults to "%.2f" (for floats) or "%d" (for ints).
+                Apparently this needs to be a valid python format, otherwise the control wont work properly.
             speed (float, optional): Speed to apply when changing values. Only applies when dragging the value and IS_SLIDER=False. Defaults to 1.0.
             is_slider (bool, optional): If we'll use a SLIDER control for editing. It contains a marker indicating the value along the range between
-                MIN<MAX (if those are valid). Otherwise defaults to using a ``drag_float`` control. Defaults to False.
-            flags (imgui.SliderFlags_, optional): Flags for the Slider/Drag float controls. Defaults to imgui.SliderFlags_.none.
+                MIN<MAX (if those are valid). Otherwise defaults to using a ``drag_float``/``drag_int`` control. Defaults to False.
+            flags (imgui.SliderFlags_, optional): Flags for the Slider/Drag controls. Defaults to imgui.SliderFlags_.none.
         """
         super().__init__(config)
         self.is_slider: bool = config.get("is_slider", False)
-        """If the float control will be a slider to easily choose between the min/max values. Otherwise the float control will
-        be a drag-float."""
+        """If the number control will be a slider to easily choose between the min/max values. Otherwise the control will
+        be a drag control."""
         self.speed: float = config.get("speed", 1.0)
         """Speed of value change when dragging the control's value. Only applies when using drag-controls (is_slider=False)"""
-        self.min: float = config.get("min", 0.0)
+        self.min: float | int = config.get("min", self._default_value)
         """Minimum value allowed. For proper automatic bounds in the control, ``max`` should also be defined, and be bigger than this minimum.
         Also use the ``always_clamp`` slider flags."""
-        self.max: float = config.get("max", 0.0)
+        self.max: float | int = config.get("max", self._default_value)
         """Maximum value allowed. For proper automatic bounds in the control, ``min`` should also be defined, and be lesser than this maximum.
         Also use the ``always_clamp`` slider flags."""
-        self.format: str = config.get("format", "%.2f")
-        """Format to use to convert value to display as text in the control (use python float format, such as ``%.2f``)"""
+        self.format: str = config.get("format", self._default_format)
+        """Format to use to convert value to display as text in the control (use python format, such as ``%.2f`` or ``%d``)"""
         self.flags: imgui.SliderFlags_ = config.get("flags", 0)
-        """Slider flags to use in imgui's float control."""
-        self.color = Colors.green
-        self.convert_value_to_type = True
-        self.extra_accepted_input_types = int
+        """Slider flags to use in imgui's number control."""
 
-    def draw_value_editor(self, value: float):
+    def draw_value_editor(self, value: float | int):
         if value is None:
-            value = 0.0
+            value = self._default_value
         if self.is_slider:
-            return imgui.slider_float("##value", value, self.min, self.max, self.format, self.flags)
+            return self._slider_control("##value", value, self.min, self.max, self.format, self.flags)
         else:
-            return imgui.drag_float("##value", value, self.speed, self.min, self.max, self.format, self.flags)
+            return self._drag_control("##value", value, self.speed, self.min, self.max, self.format, self.flags)
+
+
+@TypeDatabase.register_editor_for_type(float)
+class FloatEditor(_NumericEditor):
+    """Imgui TypeEditor for editing a FLOAT value."""
+
+    __slots__ = ()
+
+    extra_accepted_input_types = int
+    _slider_control = staticmethod(imgui.slider_float)
+    _drag_control = staticmethod(imgui.drag_float)
+    _default_value = 0.0
+    _default_format = "%.2f"
+
+    def __init__(self, config: dict):
+        super().__init__(config)
+        self.color = Colors.green
 
 
 def float_property(min=0.0, max=0.0, format="%.2f", speed=1.0, is_slider=False, flags: imgui.SliderFlags_ = 0):
@@ -168,48 +234,18 @@ def float_property(min=0.0, max=0.0, format="%.2f", speed=1.0, is_slider=False,
 
 
 @TypeDatabase.register_editor_for_type(int)
-class IntEditor(TypeEditor):
+class IntEditor(_NumericEditor):
     """Imgui TypeEditor for editing a INTEGER value."""
 
+    __slots__ = ()
+
+    extra_accepted_input_types = float
+    _slider_control = staticmethod(imgui.slider_int)
+    _drag_control = staticmethod(imgui.drag_int)
+
     def __init__(self, config: dict):
-        """
-        Args:
-            min (int, optional): Minimum allowed value for this int property. Defaults to 0.
-            max (int, optional): Maximum allowed value for this int property. Defaults to 0. If MIN >= MAX then we have no bounds.
-            format (str, optional): Text format of the value to decorate the control with. Defaults to "%d". Apparently this needs to be a valid
-                python format, otherwise the int control wont work properly.
-            speed (float, optional): Speed to apply when changing values. Only applies when dragging the value and IS_SLIDER=False. Defaults to 1.0.
-            is_slider (bool, optional): If we'll use a SLIDER control for editing. It contains a marker indicating the value along the range between
-                MIN<MAX (if those are valid). Otherwise defaults to using a ``drag_int`` control. Defaults to False.
-            flags (imgui.SliderFlags_, optional): Flags for the Slider/Drag int controls. Defaults to imgui.SliderFlags_.none.
-        """
         super().__init__(config)
-        self.is_slider: bool = config.get("is_slider", False)
-        """If the int control will be a slider to easily choose between the min/max values. Otherwise the int control will
-        be a drag-int."""
-        self.speed: float = config.get("speed", 1.0)
-        """Speed of value change when dragging the control's value. Only applies when using drag-controls (is_slider=False)"""
-        self.min: int = config.get("min", 0)
-        """Minimum value allowed. For proper automatic bounds in the control, ``max`` should also be defined, and be bigger than this minimum.
-        Also use the ``always_clamp`` slider flags."""
-        self.max: int = config.get("max", 0)
-        """Maximum value allowed. For proper automatic bounds in the control, ``min`` should also be defined, and be lesser than this maximum.
-        Also use the ``always_clamp`` slider flags."""
-        self.format: str = config.get("format", "%d")
-        """Format to use to convert value to display as text in the control (use python int format, such as ``%d``)"""
-        self.flags: imgui.SliderFlags_ = config.get("flags", 0)
-        """Slider flags to use in imgui's int control."""
         self.color = Colors.cyan
-        self.convert_value_to_type = True
-        self.extra_accepted_input_types = float
-
-    def draw_value_editor(self, value: int):
-        if value is None:
-            value = 0
-        if self.is_slider:
-            return imgui.slider_int("##value", value, self.min, self.max, self.format, self.flags)
-        else:
-            return imgui.drag_int("##value", value, self.speed, self.min, self.max, self.format, self.flags)
 
 
 def int_property(min=0, max=0, format="%d", speed=1, is_slider=False, flags: imgui.SliderFlags_ = 0):
@@ -234,12 +270,15 @@ def int_property(min=0, max=0, format="%d", speed=1, is_slider=False, flags: img
 class ColorEditor(TypeEditor):
     """Imgui TypeEditor for editing a COLOR value."""
 
+    __slots__ = ("flags",)
+
+    convert_value_to_type = True
+
     def __init__(self, config: dict):
         # flags: imgui.ColorEditFlags_ = imgui.ColorEditFlags_.none
         super().__init__(config)
         self.flags: imgui.ColorEditFlags_ = config.get("flags", 0)
         self.color = Color(1, 0.5, 0.3, 1)
-        self.convert_value_to_type = True
 
     def draw_value_editor(self, value: Color):
         if value is None:
@@ -262,6 +301,11 @@ def color_property(flags: imgui.ColorEditFlags_ = imgui.ColorEditFlags_.none):
 class Vector2Editor(TypeEditor):
     """Imgui TypeEditor for editing a Vector2 value."""
 
+    __slots__ = ("speed", "format", "flags", "x_range", "y_range", "_ranges_source", "_x_is_slider", "_x_min", "_x_max",
+                 "_y_is_slider", "_y_min", "_y_max", "_tooltips_doc", "_x_tooltip", "_y_tooltip")
+
+    convert_value_to_type = True
+
     def __init__(self, config: dict):
         super().__init__(config)
         self.speed: float = config.get("speed", 1.0)
@@ -271,31 +315,54 @@ class Vector2Editor(TypeEditor):
         self.y_range: Vector2 = config.get("y_range", (0, 0))
         self.add_tooltip_after_value = False
         self.color = Color(0, 0.5, 1, 1)
-        self.convert_value_to_type = True
+        self._ranges_source: tuple[Vector2, Vector2] = None
+        self._resolve_ranges()
+        self._tooltips_doc: str | object = _NO_TOOLTIPS_DOC
+        self._x_tooltip: str = None
+        self._y_tooltip: str = None
 
     def draw_value_editor(self, value: Vector2):
         if value is None:
             value = Vector2()
+        source = self._ranges_source
+        if source[0] is not self.x_range or source[1] is not self.y_range:
+            self._resolve_ranges()
+        if self._tooltips_doc is not self.attr_doc:
+            self._tooltips_doc = self.attr_doc
+            self._x_tooltip = f"X component of the Vector2.\n\n{self.attr_doc}"
+            self._y_tooltip = f"Y component of the Vector2.\n\n{self.attr_doc}"
         width = imgui.get_content_region_avail().x - imgui.get_style().item_spacing.x
         imgui.push_id("XComp")
         imgui.set_next_item_width(width/2)
-        x_changed, value.x = self._component_edit(value.x, self.x_range)
-        imgui.set_item_tooltip(f"X component of the Vector2.\n\n{self.attr_doc}")
+        if self._x_is_slider:
+            x_changed, value.x = imgui.slider_float("##value", value.x, self._x_min, self._x_max, self.format, self.flags)
+        else:
+            x_changed, value.x = imgui.drag_float("##value", value.x, self.speed, self._x_min, self._x_max, self.format, self.flags)
+        imgui.set_item_tooltip(self._x_tooltip)
         imgui.pop_id()
         imgui.same_line()
         imgui.push_id("YComp")
         imgui.set_next_item_width(width/2)
-        y_changed, value.y = self._component_edit(value.y, self.y_range)
-        imgui.set_item_tooltip(f"Y component of the Vector2.\n\n{self.attr_doc}")
+        if self._y_is_slider:
+            y_changed, value.y = imgui.slider_float("##value", value.y, self._y_min, self._y_max, self.format, self.flags)
+        else:
+            y_changed, value.y = imgui.drag_float("##value", value.y, self.speed, self._y_min, self._y_max, self.format, self.flags)
+        imgui.set_item_tooltip(self._y_tooltip)
         imgui.pop_id()
         return x_changed or y_changed, value
 
-    def _component_edit(self, value: float, range: tuple[float, float]):
-        min, max = range
-        if max > min:
-            return imgui.slider_float("##value", value, min, max, self.format, self.flags)
-        else:
-            return imgui.drag_float("##value", value, self.speed, min, max, self.format, self.flags)
+    def _resolve_ranges(self):
+        """Unpacks our X/Y ranges into their min/max values, and checks if each component should use a slider
+        (when it has a valid MIN < MAX range) or a drag control.
+
+        The ranges may be changed after the editor is created (by an editor-updater method, for example), so this is
+        re-run whenever ``self.x_range`` or ``self.y_range`` are not the same objects we resolved last time.
+        """
+        self._x_min, self._x_max = self.x_range
+        self._x_is_slider = self._x_max > self._x_min
+        self._y_min, self._y_max = self.y_range
+        self._y_is_slider = self._y_max > self._y_min
+        self._ranges_source = (self.x_range, self.y_range)
 
 
 def vector2_property(x_range=(0, 0), y_range=(0, 0), format="%.2f", speed=1.0, flags: imgui.SliderFlags_ = 0):
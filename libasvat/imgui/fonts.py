@@ -28,12 +28,13 @@ class FontID(str):
 class FontIDEditor(TypeEditor):
     """Imgui TypeEditor for selecting a FontID value."""
 
+    extra_accepted_input_types = str
+    convert_value_to_type = True
+
     def __init__(self, config: dict):
         super().__init__(config)
         self._options: list[FontID] = []
         self.color = Colors.yellow
-        self.extra_accepted_input_types = str
-        self.convert_value_to_type = True
 
     @property
     def sensor_options(self):
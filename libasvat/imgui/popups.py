@@ -1,21 +1,51 @@
+import weakref
+import functools
+import itertools
 from typing import Callable
 from imgui_bundle import imgui
 from libasvat.imgui.math import Vector2
 from libasvat.imgui.colors import Colors
 
 
+_POPUP_FLAGS = imgui.PopupFlags_.mouse_button_left
+"""Flags used when opening our popups."""
+_VALID_COLOR = Colors.green
+"""Color of the valid-value text in text input popups. ``Colors`` properties build a new Color each access, so we keep one."""
+_INVALID_COLOR = Colors.red
+"""Color of the invalid-value text in text input popups."""
+_default_size_cache: dict[tuple[str, float], Vector2] = {}
+"""Cache of default popup sizes, keyed by (popup title, font size). See ``get_default_popup_size()``."""
+_open_popups: set[int] = set()
+"""IDs of the popups shown by ``generic_popup()`` that are still open. Closed popups skip ``imgui.begin_popup_modal()``."""
+_ok_button_width_cache: dict[float, float] = {}
+"""Cache of the width of the popups' `Ok` button, keyed by font size. See ``_draw_cancel_ok_buttons()``."""
+_live_popups: weakref.WeakValueDictionary[int, "BasePopup"] = weakref.WeakValueDictionary()
+"""All existing ``BasePopup`` objects, keyed by creation order (weakly referenced, so they're removed when collected).
+See ``BasePopup.update_all()``."""
+_popup_counter = itertools.count()
+"""Counter used to key ``_live_popups`` by creation order."""
+
+
 class BasePopup[T]:
     """Base class to create a imgui modal popup component.
 
     This should be inherited in order to define your popup, mostly by overriding ``self.draw_contents()``.
     The popup's title (`name`) and initial `size` are set as attributes of this object.
+
+    Imgui needs the popup contents to be drawn every frame the popup is open, there's no way to "reuse" the previous frame's
+    contents. To avoid rebuilding the UI on frames without user interaction, rely on the app window's FPS idling instead
+    (see ``AppWindow.enable_fps_idling``), which throttles the frame rate while the user is idle.
     """
 
+    __slots__ = ("label", "title", "size", "_triggered", "_is_open", "__weakref__")
+
     def __init__(self, label: str, title: str, size: Vector2 = None):
         self.label: str = label
         self.title: str = title
         self.size: Vector2 = size
         self._triggered = False
+        self._is_open = False
+        _live_popups[next(_popup_counter)] = self
 
     def render(self) -> T | None:
         """Utility method to call ``self.draw_button()`` and ``self.update()`` together.
@@ -35,12 +65,37 @@ class BasePopup[T]:
         Returns:
             any: the non-None value returned by this popup's ``draw_popup_contents()`` method.
         """
-        result = generic_popup(self._triggered, self.title, self.draw_popup_contents, self.size)
+        if not (self._triggered or self._is_open):
+            return
+        size = self.size
+        if self._triggered and not size:
+            size = get_default_popup_size(self.title)
+        result, self._is_open = _run_popup(self._triggered, self.title, self._draw_contents, size, True)
         self._triggered = False
+        return result
+
+    def _draw_contents(self) -> T | None:
+        """Calls ``self.draw_popup_contents()`` inside the popup, closing it when a result is given."""
+        result = self.draw_popup_contents()
         if result is not None:
-            # Popup is opened and was confirmed
+            # Popup is opened and was confirmed. This needs to be called before the popup is ended.
             imgui.close_current_popup()
-            return result
+        return result
+
+    @classmethod
+    def update_all(cls):
+        """Updates all existing popups (see ``self.update()``) in a single pass, inside a shared imgui ID context.
+
+        This can be called once per frame instead of calling ``update()`` of each popup. In that case, ``update()``
+        shouldn't be called separately for any popup, since the popup's ID context would differ.
+        Closed popups are skipped right away, so this is cheap even with lots of popups.
+        """
+        imgui.push_id("popups")
+        # Popup contents may create new popups, so we iterate over a snapshot.
+        for popup in list(_live_popups.values()):
+            if isinstance(popup, cls) and (popup._triggered or popup._is_open):
+                popup.update()
+        imgui.pop_id()
 
     def draw_button(self, in_menu=False):
         """Draws a button with our ``self.label`` that will ``self.open()`` this popup when pressed.
@@ -73,14 +128,14 @@ class BasePopup[T]:
         raise NotImplementedError
 
 
-def generic_popup[T](trigger_open: bool, title: str, contents: Callable[[], T], size: Vector2 = None) -> T | None:
+def generic_popup[T](trigger_open: bool, title: str, contents: Callable[[], T], size: Vector2 = None, closable=True) -> T | None:
     """Imgui utility to open and render a GENERIC popup.
 
     The popup is a simple modal popup, meaning it displays as a overlay on top of everything else,
     blocking interactions until the popup is closed. The popup window:
     * Has the given `title` in the title bar.
     * Has the initial given `size`, and can be resized by the user afterwards.
-    * Has a `X` close button besides the title, that allows closing the popup.
+    * Has a `X` close button besides the title, that allows closing the popup (unless `closable` is False).
     * Will use the given `contents()` function to draw imgui contents inside the popup:
         * The `contents()` can use ``imgui.close_current_popup()`` to close the popup programatically.
         * The value returned by `contents()` is the one returned by this function. So the popup can give out a return value of some
@@ -91,37 +146,94 @@ def generic_popup[T](trigger_open: bool, title: str, contents: Callable[[], T],
             as the return from `imgui.button()`.
         title (str): Title of the popup window. Ideally, this should be unique between popups in the same Imgui context.
         contents (callable() -> T): Callable that when executed will draw (using imgui) the popup's contents.
-        size (Vector2, optional): Initial size of the popup window when opened. Defaults to the title's size x(2, 8).
+        size (Vector2, optional): Initial size of the popup window when opened. Defaults to the title's size x(4, 16).
+        closable (bool, optional): If the popup has the `X` close button. Defaults to True.
 
     Returns:
         T: the value returned by the ``contents()`` function, or None if the popup isn't opened.
     """
+    return _run_popup(trigger_open, title, contents, size, closable)[0]
+
+
+def _run_popup[T](trigger_open: bool, title: str, contents: Callable[[], T], size: Vector2, closable: bool) -> tuple[T | None, bool]:
+    """Implementation of ``generic_popup()``.
+
+    Returns:
+        tuple[T, bool]: the value returned by ``contents()`` (or None), and if the popup is still open after this frame.
+    """
+    popup_id = imgui.get_id(title)
     if trigger_open:
         # NOTE: open_popup needs to be called in the same imgui ID context as its begin_popup.
-        imgui.open_popup(title, imgui.PopupFlags_.mouse_button_left)
+        imgui.open_popup(title, _POPUP_FLAGS)
         if not size:
-            size = Vector2(*imgui.calc_text_size(title)) * (4, 16)
+            size = get_default_popup_size(title)
         imgui.set_next_window_size(size)
+        _open_popups.add(popup_id)
+    elif not _is_popup_open(popup_id, title):
+        # Popup is closed: no need to go through begin_popup_modal's checks.
+        return None, False
 
     result = None
-    opened, is_visible = imgui.begin_popup_modal(title, True)
+    if closable:
+        opened, is_visible = imgui.begin_popup_modal(title, True)
+    else:
+        opened, is_visible = imgui.begin_popup_modal(title)
     if opened:
         result = contents()
-        if not is_visible:
+        if closable and not is_visible:
+            # User pressed the X button.
             imgui.close_current_popup()
         imgui.end_popup()
+    else:
+        _open_popups.discard(popup_id)
 
-    return result
+    return result, opened
+
+
+def _is_popup_open(popup_id: int, title: str):
+    """Checks if the popup with the given imgui ID and title is open, tracking it in ``_open_popups`` if so.
+
+    Popups opened by ``generic_popup()`` are already tracked, but the popup may also have been opened directly with
+    ``imgui.open_popup()``, so imgui's own state is checked for untracked popups.
+    """
+    if popup_id in _open_popups:
+        return True
+    if imgui.is_popup_open(title):
+        _open_popups.add(popup_id)
+        return True
+    return False
+
+
+def get_default_popup_size(title: str) -> Vector2:
+    """Gets the default initial size of a popup window with the given title, when no explicit size is specified.
 
+    This is the size of the `title` text multiplied by (4, 16). Since measuring the text goes through imgui's font atlas,
+    the result is cached by title and current font size, so repeated openings of the same popup skip the text measurement.
 
-def generic_button_with_popup[T](label: str, title: str, contents: Callable[[], T], size: Vector2 = None, in_menu=False) -> T | None:
+    Args:
+        title (str): Title of the popup window.
+
+    Returns:
+        Vector2: the default size of the popup window. This is a cached object, so don't change it in-place.
+    """
+    key = (title, imgui.get_font_size())
+    size = _default_size_cache.get(key)
+    if size is None:
+        text_size = imgui.calc_text_size(title)
+        size = Vector2(text_size.x * 4, text_size.y * 16)
+        _default_size_cache[key] = size
+    return size
+
+
+def generic_button_with_popup[T](label: str, title: str, contents: Callable[[], T], size: Vector2 = None, in_menu=False,
+                                 closable=True) -> T | None:
     """Imgui utility to display a button with the given `label`, that when pressed will open a GENERIC popup.
 
     The popup is a simple modal popup, meaning it displays as a overlay on top of everything else,
     blocking interactions until the popup is closed. The popup window:
     * Has the given `title` in the title bar.
     * Has the initial given `size`, and can be resized by the user afterwards.
-    * Has a `X` close button besides the title, that allows closing the popup.
+    * Has a `X` close button besides the title, that allows closing the popup (unless `closable` is False).
     * Will use the given `contents()` function to draw imgui contents inside the popup:
         * The `contents()` can use ``imgui.close_current_popup()`` to close the popup programatically.
         * The value returned by `contents()` is the one returned by this function. So the popup can give out a return value of some
@@ -131,9 +243,10 @@ def generic_button_with_popup[T](label: str, title: str, contents: Callable[[],
         label (str): Label of the button to open the popup.
         title (str): Title of the popup window. Ideally, this should be unique between popups in the same Imgui context.
         contents (callable() -> T): Callable that when executed will draw (using imgui) the popup's contents.
-        size (Vector2, optional): Initial size of the popup window when opened. Defaults to the title's size x(2, 8).
+        size (Vector2, optional): Initial size of the popup window when opened. Defaults to the title's size x(4, 16).
         in_menu (bool, optional): If this is being called inside a imgui menu. If true, we'll use ``imgui.menu_item_simple(label)``
             to draw the button for user interaction, otherwise the default ``imgui.button(label)`` will be used.
+        closable (bool, optional): If the popup has the `X` close button. Defaults to True.
 
     Returns:
         T: the value returned by the ``contents()`` function, or None if the popup isn't opened.
@@ -142,7 +255,172 @@ def generic_button_with_popup[T](label: str, title: str, contents: Callable[[],
         trigger = imgui.menu_item_simple(label)
     else:
         trigger = imgui.button(label)
-    return generic_popup(trigger, title, contents, size)
+    return generic_popup(trigger, title, contents, size, closable)
+
+
+def _draw_cancel_ok_buttons(ok_enabled=True) -> bool:
+    """Draws the `Cancel` and `Ok` buttons of our popups, with `Ok` aligned to the right. Either button closes the current popup.
+
+    Args:
+        ok_enabled (bool, optional): If the `Ok` button is enabled. Defaults to True.
+
+    Returns:
+        bool: if the `Ok` button was pressed.
+    """
+    if imgui.button("Cancel"):
+        imgui.close_current_popup()
+    font_size = imgui.get_font_size()
+    ok_width = _ok_button_width_cache.get(font_size)
+    if ok_width is None:
+        ok_width = imgui.calc_text_size("Ok").x + imgui.get_style().frame_padding.x * 2 + 4
+        _ok_button_width_cache[font_size] = ok_width
+    imgui.same_line(imgui.get_content_region_avail().x - ok_width)
+    if not ok_enabled:
+        imgui.begin_disabled()
+    confirmed = imgui.button("Ok")
+    if confirmed:
+        imgui.close_current_popup()
+    if not ok_enabled:
+        imgui.end_disabled()
+    return confirmed
+
+
+def _draw_wrapped_text(message: str):
+    """Draws the given text message word-wrapped to the available width, like ``imgui.text_wrapped()``.
+
+    Popup messages are usually static, and the popup's width rarely changes, so instead of letting imgui re-wrap the
+    text every frame, the wrapped text is cached (see ``_wrap_text()``) by font, font size and width in steps of 16 pixels.
+
+    Args:
+        message (str): the text to display.
+    """
+    width = int(imgui.get_content_region_avail().x / 16) * 16
+    imgui.text_unformatted(_wrap_text(message, width, imgui.get_font(), imgui.get_font_size()))
+
+
+@functools.lru_cache(maxsize=256)
+def _wrap_text(message: str, width: float, font: imgui.ImFont, font_size: float) -> str:
+    """Word-wraps the given text to fit in the given width, using imgui to measure the text with the current font.
+
+    Args:
+        message (str): the text to wrap. Existing line breaks are kept.
+        width (float): maximum width, in pixels, of each line.
+        font (ImFont): current font. Only used as part of the cache key, since different fonts measure differently.
+        font_size (float): current font size. Only used as part of the cache key, since it changes the measured widths.
+
+    Returns:
+        str: the wrapped text, with lines separated by line breaks.
+    """
+    lines = []
+    for paragraph in message.split("\n"):
+        line = ""
+        for word in paragraph.split(" "):
+            candidate = f"{line} {word}" if line else word
+            if line and imgui.calc_text_size(candidate).x > width:
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+        lines.append(line)
+    return "\n".join(lines)
+
+
+class _ValidationMemo:
+    """Memo of the last validation of a text-input popup's value.
+
+    Text-input popups validate their value every frame, while the value only changes on user input. So this only calls
+    the validator when the value (or the validator) differs from the last validation.
+
+    Each popup has its own memo, which should be reset when the popup is opened, since validators may depend on
+    outside state (such as checking if a name is unique) that may have changed since the popup was last open.
+    """
+
+    __slots__ = ("validator", "value", "result")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Clears the memoized validation, so the next ``validate()`` calls the validator."""
+        self.validator: Callable[[str], tuple[bool, str]] = None
+        self.value: str = None
+        self.result: tuple[bool, str] = None
+
+    def validate(self, validator: Callable[[str], tuple[bool, str]], value: str) -> tuple[bool, str]:
+        """Validates the given text-input value with the validator, reusing the last result if nothing changed.
+
+        Validators are compared by equality, so a new bound method of the same object and function (such as
+        ``self.check`` given each frame) still reuses the result.
+
+        Args:
+            validator (Callable[[str], tuple[bool, str]]): the validator callable. See ``button_with_text_input()``.
+            value (str): the value to validate.
+
+        Returns:
+            tuple[bool, str]: the `(valid, reason)` result of the validator.
+        """
+        if self.result is None or value != self.value or validator != self.validator:
+            self.result = validator(value)
+            self.validator = validator
+            self.value = value
+        return self.result
+
+
+class _ConfirmationContents:
+    """Callable that draws the contents of a Ok/Cancel confirmation popup. See ``confirmation_popup_contents()``.
+
+    This is a persistent object, instead of a closure built each frame, so ``button_with_confirmation()`` can reuse it.
+    """
+
+    __slots__ = ("message",)
+
+    def __init__(self, message: str):
+        self.message = message
+
+    def __call__(self) -> bool:
+        _draw_wrapped_text(self.message)
+        return _draw_cancel_ok_buttons()
+
+
+class _TextInputContents:
+    """Callable that draws the contents of a text input popup. See ``button_with_text_input()``.
+
+    This is a persistent object, instead of a closure built each frame, so ``button_with_text_input()`` can reuse it.
+    """
+
+    __slots__ = ("message", "value", "validator", "validation")
+
+    def __init__(self):
+        self.message: str = ""
+        self.value: str = ""
+        self.validator: Callable[[str], tuple[bool, str]] = None
+        self.validation = _ValidationMemo()
+
+    def __call__(self) -> tuple[bool, str]:
+        _draw_wrapped_text(self.message)
+
+        changed, new_value = imgui.input_text("##", self.value)
+        if changed:
+            self.value = new_value
+        # NOTE: on unchanged frames we keep using the same str object, which makes the validation memo check trivial.
+        is_valid = True
+        if self.validator is not None:
+            is_valid, reason = self.validation.validate(self.validator, self.value)
+            if is_valid:
+                imgui.text_colored(_VALID_COLOR, "Value is valid.")
+            else:
+                imgui.push_text_wrap_pos()
+                imgui.text_colored(_INVALID_COLOR, f"Invalid value: {reason}")
+                imgui.pop_text_wrap_pos()
+
+        confirmed = _draw_cancel_ok_buttons(is_valid)
+        return confirmed, self.value
+
+
+_confirmation_contents: dict[int, _ConfirmationContents] = {}
+"""Contents objects of the open popups of ``button_with_confirmation()``, by popup imgui ID."""
+_text_input_contents: dict[int, _TextInputContents] = {}
+"""Contents objects of the open popups of ``button_with_text_input()``, by popup imgui ID."""
 
 
 def confirmation_popup_contents(message: str):
@@ -152,22 +430,10 @@ def confirmation_popup_contents(message: str):
         message (str): Message to display inside the popup contents.
 
     Returns:
-        function: a `() -> bool` callable that draws the popup's contents using IMGUI. The returned boolean indicates if the popup
+        callable: a `() -> bool` callable that draws the popup's contents using IMGUI. The returned boolean indicates if the popup
         was closed with confirmation by the user or not.
     """
-    def draw_contents() -> bool:
-        imgui.text_wrapped(message)
-        confirmed = False
-        if imgui.button("Cancel"):
-            imgui.close_current_popup()
-        width = imgui.get_content_region_avail().x
-        imgui.same_line(width - 30)
-        if imgui.button("Ok"):
-            confirmed = True
-            imgui.close_current_popup()
-        return confirmed
-
-    return draw_contents
+    return _ConfirmationContents(message)
 
 
 def button_with_confirmation(label: str, title: str, message: str, size: Vector2 = None):
@@ -185,7 +451,19 @@ def button_with_confirmation(label: str, title: str, message: str, size: Vector2
     Returns:
         bool: if the user confirmed the selection inside the popup or not.
     """
-    return generic_button_with_popup(label, title, confirmation_popup_contents(message), size)
+    trigger = imgui.button(label)
+    popup_id = imgui.get_id(title)
+    contents = _confirmation_contents.get(popup_id)
+    if contents is None:
+        if not (trigger or _is_popup_open(popup_id, title)):
+            return
+        contents = _confirmation_contents[popup_id] = _ConfirmationContents(message)
+    else:
+        contents.message = message
+    result, opened = _run_popup(trigger, title, contents, size, True)
+    if not opened:
+        del _confirmation_contents[popup_id]
+    return result
 
 
 def button_with_text_input(label: str, title: str, message: str, value: str, validator: Callable[[str], tuple[bool, str]] = None,
@@ -214,33 +492,25 @@ def button_with_text_input(label: str, title: str, message: str, value: str, val
         or not (user confirmed the selected value); and `value` is the new selected value that the user might've edited.
         This returned `value` should substitute the received arg `value` in the next frame.
     """
-    def contents() -> tuple[bool, str]:
-        imgui.text_wrapped(message)
-
-        changed, new_value = imgui.input_text("##", value)
-        is_valid = True
-        if validator is not None:
-            is_valid, reason = validator(new_value)
-            if is_valid:
-                imgui.text_colored(Colors.green, "Value is valid.")
-            else:
-                imgui.push_text_wrap_pos()
-                imgui.text_colored(Colors.red, f"Invalid value: {reason}")
-                imgui.pop_text_wrap_pos()
-
-        confirmed = False
-        if imgui.button("Cancel"):
-            imgui.close_current_popup()
-        width = imgui.get_content_region_avail().x
-        imgui.same_line(width - 30)
-        imgui.begin_disabled(not is_valid)
-        if imgui.button("Ok"):
-            confirmed = True
-            imgui.close_current_popup()
-        imgui.end_disabled()
-        return confirmed, new_value
-
-    return generic_button_with_popup(label, title, contents, size, in_menu)
+    if in_menu:
+        trigger = imgui.menu_item_simple(label)
+    else:
+        trigger = imgui.button(label)
+    popup_id = imgui.get_id(title)
+    contents = _text_input_contents.get(popup_id)
+    if contents is None:
+        if not (trigger or _is_popup_open(popup_id, title)):
+            return
+        contents = _text_input_contents[popup_id] = _TextInputContents()
+    elif trigger:
+        contents.validation.reset()
+    contents.message = message
+    contents.value = value
+    contents.validator = validator
+    result, opened = _run_popup(trigger, title, contents, size, True)
+    if not opened:
+        del _text_input_contents[popup_id]
+    return result
 
 
 class TextInputPopup(BasePopup[str]):
@@ -257,37 +527,37 @@ class TextInputPopup(BasePopup[str]):
     This is essentially the same as the utility function ``button_with_text_input``, but easier to use.
     """
 
+    __slots__ = ("message", "value", "validator", "_validation")
+
     def __init__(self, label: str, title: str, message: str, initial_value: str = "", validator: Callable[[str], tuple[bool, str]] = None,
                  size: Vector2 = None):
         super().__init__(label, title, size)
         self.message = message
         self.value = initial_value
         self.validator = validator
+        self._validation = _ValidationMemo()
+
+    def open(self):
+        self._validation.reset()
+        super().open()
 
     def draw_popup_contents(self):
-        imgui.text_wrapped(self.message)
+        _draw_wrapped_text(self.message)
 
-        changed, self.value = imgui.input_text("##", self.value)
+        changed, new_value = imgui.input_text("##", self.value)
+        if changed:
+            self.value = new_value
         is_valid = True
         if self.validator is not None:
-            is_valid, reason = self.validator(self.value)
+            is_valid, reason = self._validation.validate(self.validator, self.value)
             if is_valid:
-                imgui.text_colored(Colors.green, f"Valid: {reason}")
+                imgui.text_colored(_VALID_COLOR, f"Valid: {reason}")
             else:
                 imgui.push_text_wrap_pos()
-                imgui.text_colored(Colors.red, f"Invalid value: {reason}")
+                imgui.text_colored(_INVALID_COLOR, f"Invalid value: {reason}")
                 imgui.pop_text_wrap_pos()
 
-        confirmed = False
-        if imgui.button("Cancel"):
-            imgui.close_current_popup()
-        width = imgui.get_content_region_avail().x
-        imgui.same_line(width - 30)
-        imgui.begin_disabled(not is_valid)
-        if imgui.button("Ok"):
-            confirmed = True
-            imgui.close_current_popup()
-        imgui.end_disabled()
+        confirmed = _draw_cancel_ok_buttons(is_valid)
 
         if confirmed:
             return self.value
@@ -1,144 +1,277 @@
+import sys
 import click
-from enum import Enum
+from enum import IntEnum
+from collections import deque
 from imgui_bundle import imgui
 from libasvat.imgui.colors import Colors
 
 
-class LogType(str, Enum):
-    """Possible types of a Logger message."""
-    INFO = "INFO"
-    GOOD = "GOOD"
-    WARNING = "WARNING"
-    ERROR = "ERROR"
+class LogType(IntEnum):
+    """Possible types of a Logger message.
+
+    The value of each type is its ordinal, used to index the per-type tables (such as colors) of this module.
+    """
+    INFO = 0
+    GOOD = 1
+    WARNING = 2
+    ERROR = 3
 
     @property
     def color_rgba(self):
         """Gets the RGBA color associated with this log type (for use with IMGUI)."""
-        mapping = {
-            self.INFO: Colors.white,
-            self.GOOD: Colors.green,
-            self.WARNING: Colors.yellow,
-            self.ERROR: Colors.red,
-        }
-        return mapping[self]
+        return _COLOR_RGBA_BY_INDEX[self]
 
     @property
     def color_name(self):
         """Gets the color name (a string) associated with this log type (for use with Click)."""
-        mapping = {
-            self.INFO: "white",
-            self.GOOD: "green",
-            self.WARNING: "yellow",
-            self.ERROR: "red",
-        }
-        return mapping[self]
+        return _COLOR_NAME_BY_INDEX[self]
+
+
+_COLOR_RGBA_BY_INDEX = (Colors.white, Colors.green, Colors.yellow, Colors.red)
+"""RGBA color of each LogType, indexed by their ordinal. See ``LogType.color_rgba``."""
+_COLOR_NAME_BY_INDEX = ("white", "green", "yellow", "red")
+"""Click color name of each LogType, indexed by their ordinal. See ``LogType.color_name``."""
+_ANSI_PREFIX_BY_INDEX = tuple(click.style("", fg=name, reset=False) for name in _COLOR_NAME_BY_INDEX)
+"""ANSI escape sequence (as generated by ``click.style``) that starts the console color of each LogType, indexed by their ordinal."""
+_ANSI_RESET = "\x1b[0m"
+"""ANSI escape sequence that resets the console style, at the end of styled messages."""
+
+
+def _intern_tag(tag: str | None):
+    """Interns the given tag string (see ``sys.intern``), so all messages with the same tag share the same string object,
+    even when loaded from JSON. Non-string tags (such as None) are returned as-is."""
+    if type(tag) is str:
+        return sys.intern(tag)
+    return tag
 
 
 class LogMessage:
-    """Represents a message saved by a Logger object."""
+    """Represents a message saved by a Logger object.
+
+    The message may be a ``%``-style format string with the given ``args``, which are only interpolated when the
+    message's text is first needed (like the standard ``logging`` module does).
+
+    The string representation of the message (and its click-styled version) is cached when first used, since
+    messages are usually drawn every frame. So the message's attributes shouldn't be changed after that.
+    """
 
-    def __init__(self, tag: str, message: str, logtype: LogType):
-        self.tag = tag
+    __slots__ = ("tag", "message", "logtype", "args", "_text", "_styled_text", "_json")
+
+    def __init__(self, tag: str, message: str, logtype: LogType, args: tuple = ()):
+        self.tag = _intern_tag(tag)
         self.message = message
         self.logtype = logtype
+        self.args = args
+        self._text: str = None
+        self._styled_text: str = None
+        self._json: dict = None
 
     def styled(self):
         """Returns a click-styled version of this logs's string representation."""
-        return click.style(str(self), fg=self.logtype.color_name)
+        if self._styled_text is None:
+            # Same as ``click.style(str(self), fg=self.logtype.color_name)``, but with the style sequences prebuilt.
+            self._styled_text = f"{_ANSI_PREFIX_BY_INDEX[self.logtype]}{self}{_ANSI_RESET}"
+        return self._styled_text
+
+    def draw(self, wrap=True):
+        """Draws this log message using IMGUI.
 
-    def draw(self):
-        """Draws this log message using IMGUI."""
-        imgui.push_text_wrap_pos()
+        Args:
+            wrap (bool, optional): If true, will push a text-wrap position for this message, so its text wraps at the end of the
+                available content region. Can be False when drawing several messages, if the caller pushes the wrap position
+                only once for all of them (as ``Logger.draw()`` does). Defaults to True.
+        """
+        if wrap:
+            imgui.push_text_wrap_pos()
         imgui.text_colored(self.logtype.color_rgba, str(self))
-        imgui.pop_text_wrap_pos()
+        if wrap:
+            imgui.pop_text_wrap_pos()
+
+    def get_message(self) -> str:
+        """Gets the message text, interpolating our ``args`` in the message (as ``message % args``), if we have any.
+
+        If the interpolation fails (bad format string or wrong number of args), the message and the repr of the args
+        are returned instead, so a bad log call doesn't raise errors when the message is drawn or saved."""
+        if self.args:
+            try:
+                return self.message % self.args
+            except (TypeError, ValueError):
+                return f"{self.message} {self.args!r}"
+        return self.message
 
     def __str__(self):
-        if self.tag is not None and self.tag != "":
-            return f"[{self.tag}] {self.message}"
-        return self.message
+        if self._text is None:
+            if self.tag is not None and self.tag != "":
+                self._text = f"[{self.tag}] {self.get_message()}"
+            else:
+                self._text = self.get_message()
+        return self._text
 
     def to_json(self):
-        """Converts this object to a JSON representation of itself for persistence."""
-        return vars(self).copy()
+        """Converts this object to a JSON representation of itself for persistence.
+
+        The message is saved already interpolated with its args (if any), since these may not be JSON-serializable.
+        Like our string representation, the JSON dict is cached when first built, so the returned dict shouldn't be modified."""
+        if self._json is None:
+            self._json = {"tag": self.tag, "message": self.get_message(), "logtype": self.logtype.name}
+        return self._json
 
     @classmethod
     def from_json(cls, json_data: dict):
         """Loads a instance of this class based on the given JSON_DATA dict."""
-        data = json_data.copy()
-        data["logtype"] = LogType(data["logtype"])
-        obj = cls(None, None, None)
-        obj.__dict__.update(data)
-        return obj
+        logtype = json_data["logtype"]
+        # LogTypes are saved by name, but also accept their int value.
+        logtype = LogType[logtype] if isinstance(logtype, str) else LogType(logtype)
+        return cls(json_data["tag"], json_data["message"], logtype)
+
+
+_TABLE_FLAGS = imgui.TableFlags_.row_bg | imgui.TableFlags_.sizing_fixed_fit
+"""Flags of the table used to draw the messages in ``Logger.draw()``."""
+_COLUMN_FLAGS = imgui.TableColumnFlags_.no_resize
+"""Flags of the messages column of the table in ``Logger.draw()``."""
 
 
 class Logger:
     """Utility to store messages with metadata, which can then be printed to the console
     or draw onscreen with IMGUI."""
 
-    def __init__(self, tag: str = None):
-        self._tag = tag
-        self.messages: list[LogMessage] = []
+    __slots__ = ("_tag", "messages", "collect", "_type_counts", "_default_label")
+
+    def __init__(self, tag: str = None, max_messages: int = None, collect=True):
+        """
+        Args:
+            tag (str, optional): Tag of this logger, added to all its messages. Defaults to None.
+            max_messages (int, optional): Maximum number of messages to keep. When logging beyond this limit, the oldest
+                messages are discarded. Defaults to None, meaning there is no limit.
+            collect (bool, optional): If logged messages should be stored in this logger. See ``self.collect``. Defaults to True.
+        """
+        self._tag = _intern_tag(tag)
+        self._default_label: str = str(self._tag)
+        """Default label (title) of this logger in ``self.draw()``."""
+        self.messages: deque[LogMessage] = deque(maxlen=max_messages)
+        self.collect: bool = collect
+        """If logged messages are stored in this logger (in ``self.messages``), in order to be drawn or saved later.
+
+        If False, messages are only outputted to the console (when logged with ``output=True``), and logging messages
+        without output does nothing.
+        """
+        self._type_counts: list[int] = [0] * len(LogType)
+        """Number of stored messages of each LogType (indexed by their ordinal). See ``self.count()``."""
+
+    def log(self, message: str, logtype: LogType, *args, output=False):
+        """Logs a message with the given LogType.
 
-    def log(self, message: str, logtype: LogType, output=False):
-        """Logs a message with the given LogType."""
-        msg = LogMessage(self._tag, message, logtype)
-        self.messages.append(msg)
+        Args:
+            message (str): the message to log. If ARGS are given, this is a ``%``-style format string for them.
+            logtype (LogType): the type of the message.
+            *args: optional values to interpolate in the message. Formatting is delayed until the message's text is
+                needed, so it is skipped entirely if the message is never outputted or drawn.
+            output (bool, optional): If true, the message is also printed to the console. Defaults to False.
+        """
+        if not (self.collect or output):
+            return
+        msg = LogMessage(self._tag, message, logtype, args)
+        if self.collect:
+            self._add_message(msg)
         if output:
             click.echo(msg.styled())
 
-    def get_logs(self):
-        """Generator of messages from this Logger."""
-        return (msg for msg in self.messages)
+    def _add_message(self, msg: LogMessage):
+        """Stores the given message in this logger, updating our message counts."""
+        messages = self.messages
+        maxlen = messages.maxlen
+        if maxlen is not None and len(messages) >= maxlen:
+            if maxlen <= 0:
+                return
+            # Appending will discard the oldest message.
+            self._type_counts[messages[0].logtype] -= 1
+        messages.append(msg)
+        self._type_counts[msg.logtype] += 1
+
+    def get_logs(self, logtype: LogType = None):
+        """Generator of messages from this Logger.
+
+        Args:
+            logtype (LogType, optional): If given, only messages of this type are returned. Defaults to None (all messages).
+        """
+        if logtype is None:
+            return (msg for msg in self.messages)
+        return (msg for msg in self.messages if msg.logtype == logtype)
+
+    def count(self, logtype: LogType = None) -> int:
+        """Gets the number of messages stored in this logger.
+
+        The number of messages of each type is kept up to date as messages are logged, so this is cheap to call
+        every frame. It only accounts for messages added by this Logger (such as with ``self.log()``), and not
+        for direct changes to ``self.messages``.
+
+        Args:
+            logtype (LogType, optional): If given, only counts messages of this type. Defaults to None (all messages).
+
+        Returns:
+            int: number of messages.
+        """
+        if logtype is None:
+            return len(self.messages)
+        return self._type_counts[logtype]
 
     def clear(self):
         """Clear all logs stored in this logger instance."""
         self.messages.clear()
+        self._type_counts = [0] * len(LogType)
 
-    def info(self, message: str, output=False):
-        """Logs a INFO-type message."""
-        self.log(message, LogType.INFO, output=output)
+    def info(self, message: str, *args, output=False):
+        """Logs a INFO-type message. See ``self.log()``."""
+        self.log(message, LogType.INFO, *args, output=output)
 
-    def good(self, message: str, output=False):
-        """Logs a GOOD-type message."""
-        self.log(message, LogType.GOOD, output=output)
+    def good(self, message: str, *args, output=False):
+        """Logs a GOOD-type message. See ``self.log()``."""
+        self.log(message, LogType.GOOD, *args, output=output)
 
-    def warning(self, message: str, output=False):
-        """Logs a WARNING-type message."""
-        self.log(message, LogType.WARNING, output=output)
+    def warning(self, message: str, *args, output=False):
+        """Logs a WARNING-type message. See ``self.log()``."""
+        self.log(message, LogType.WARNING, *args, output=output)
 
-    def error(self, message: str, output=False):
-        """Logs a ERROR-type message."""
-        self.log(message, LogType.ERROR, output=output)
+    def error(self, message: str, *args, output=False):
+        """Logs a ERROR-type message. See ``self.log()``."""
+        self.log(message, LogType.ERROR, *args, output=output)
 
     def to_json(self):
-        """Converts this object to a JSON representation of itself for persistence."""
-        data = vars(self).copy()
-        data["messages"] = []
-        for msg in self.messages:
-            data["messages"].append(msg.to_json())
-        return data
+        """Converts this object to a JSON representation of itself for persistence.
+
+        The JSON of each message is cached in the message (see ``LogMessage.to_json()``), so saving a logger repeatedly
+        only builds the JSON of new messages."""
+        return {
+            "_tag": self._tag,
+            "max_messages": self.messages.maxlen,
+            "collect": self.collect,
+            "messages": [msg.to_json() for msg in self.messages],
+        }
 
     @classmethod
     def from_json(cls, json_data: dict):
         """Loads a instance of this class based on the given JSON_DATA dict."""
-        data = json_data.copy()
-        obj = cls()
-        messages: list[dict] = data.pop("messages")
-        obj.__dict__.update(data)
-        for msg_data in messages:
-            obj.messages.append(LogMessage.from_json(msg_data))
+        obj = cls(json_data.get("_tag"), json_data.get("max_messages"), json_data.get("collect", True))
+        for msg_data in json_data["messages"]:
+            obj._add_message(LogMessage.from_json(msg_data))
         return obj
 
     def copy(self):
-        """Copies this Logger, returning a brand new Logger instance with the same tag/messages."""
-        return self.__class__.from_json(self.to_json())
+        """Copies this Logger, returning a brand new Logger instance with the same tag/messages.
+
+        This is a shallow copy: the new logger has its own messages container, but shares the same LogMessage objects,
+        since these aren't changed after being created."""
+        new = self.__class__(self._tag, self.messages.maxlen, self.collect)
+        new.messages.extend(self.messages)
+        new._type_counts = self._type_counts.copy()
+        return new
 
     def draw(self, title: str = None, use_tree_node=False, use_indent=False, use_region=True, region_size: imgui.ImVec2 = None):
         """Draws this logger using IMGUI.
 
         This draws our messages as a list to allow users to read the messages. The messages have alternating background
         "row" colors in each message to facilitate reading, and all messages are always contained inside a collapsible
-        imgui structure.
+        imgui structure. If the logger has no messages, only its collapsible header is drawn.
 
         Args:
             title (str,optional): Title of this logger to use in this display. If None, defaults to our TAG.
@@ -152,28 +285,44 @@ class Logger:
                 if `use_region` is True. This is the same `size` as passed to `imgui.begin_child()`. Defaults to None, which means
                 using all available content size.
         """
-        label = title or str(self._tag)
+        label = title or self._default_label
         if use_tree_node:
             if not imgui.tree_node(label):
                 return
         elif not imgui.collapsing_header(label):
             return
 
+        if not self.messages:
+            # Nothing to draw besides the header itself. Skip the (empty) region and table.
+            if use_tree_node:
+                imgui.tree_pop()
+            return
+
         if use_region:
             imgui.begin_child(label, size=region_size)
 
         width = imgui.get_content_region_avail().x
-        if imgui.begin_table(label, 1, imgui.TableFlags_.row_bg | imgui.TableFlags_.sizing_fixed_fit):
-            imgui.table_setup_column("Logs", init_width_or_weight=width, flags=imgui.TableColumnFlags_.no_resize)
-
-            for msg in self.get_logs():
-                imgui.table_next_row()
-                imgui.table_next_column()
-                if use_indent:
+        if imgui.begin_table(label, 1, _TABLE_FLAGS):
+            imgui.table_setup_column("Logs", init_width_or_weight=width, flags=_COLUMN_FLAGS)
+
+            # All messages wrap the same way, so the wrap position is pushed only once for all of them.
+            # Each message is kept in its own row (instead of joining consecutive same-colored messages into one text)
+            # so that they keep their alternating row backgrounds.
+            imgui.push_text_wrap_pos()
+            # The indent choice is the same for all messages, so we have one loop for each case.
+            if use_indent:
+                for msg in self.messages:
+                    imgui.table_next_row()
+                    imgui.table_next_column()
                     imgui.indent()
-                msg.draw()
-                if use_indent:
+                    msg.draw(wrap=False)
                     imgui.unindent()
+            else:
+                for msg in self.messages:
+                    imgui.table_next_row()
+                    imgui.table_next_column()
+                    msg.draw(wrap=False)
+            imgui.pop_text_wrap_pos()
 
             imgui.end_table()
         if use_region:
@@ -29,5 +29,6 @@ setuptools.setup(
         "imgui-bundle",  # GUI
         "debugpy",  # Enables python debugger
         "google-api-python-client", "google-auth-oauthlib",  # Libs for Google Sheet and related auth
+        "google-auth-httplib2", "httplib2",  # HTTP transport used by the Google Sheet service
     ]
 )